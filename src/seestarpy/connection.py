@@ -1,11 +1,19 @@
+import asyncio
 import atexit
+import copy
 import json
 import socket
 import threading
-from functools import wraps
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from functools import lru_cache, wraps
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 
+try:  # optional speed-up: pip install seestarpy[fast]
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 VERBOSE_LEVEL = 1
 DEFAULT_PORT = 4700
 
@@ -151,6 +159,114 @@ def multiple_ips(func):
     return wrapper
 
 
+def ttl_cache(ttl, should_cache=None):
+    """
+    Decorator that memoises a read-only query for *ttl* seconds per Seestar.
+
+    Repeated calls within *ttl* seconds of the last real call, with the same
+    arguments and the same :func:`current_ip`, return the cached result
+    instead of another round-trip.  Concurrent callers that miss the cache
+    for the same key share a single in-flight query ("single-flight")
+    rather than each sending a duplicate; a waiter gives up after one
+    socket read timeout and queries the device itself.  ``cache_clear()``
+    also forgets in-flight queries: their (possibly stale) result isn't
+    stored, and later callers start a fresh query instead of joining them.
+    Meant for status getters that UI or monitoring code polls in a loop;
+    never use it on commands with side effects.
+
+    The decorated function gains a writable ``ttl`` attribute (set it to
+    ``0`` to disable caching) and a ``cache_clear()`` method, which callers
+    that change the underlying state should invoke.  :func:`clear_ttl_caches`
+    empties every such cache at once.
+
+    Every caller gets its own deep copy of the result, so mutating a
+    returned value never corrupts the cache.
+
+    Parameters
+    ----------
+    ttl : float
+        Lifetime of a cached result in seconds.
+    should_cache : callable, optional
+        ``should_cache(result) -> bool``; results it rejects (e.g. device
+        error replies) are returned but not stored, so one failed poll
+        isn't replayed for the whole *ttl*.  By default every result is
+        stored.
+    """
+    def decorator(func):
+        cache = {}
+        inflight = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if wrapper.ttl <= 0:
+                return func(*args, **kwargs)
+            try:
+                key = (current_ip(), args, frozenset(kwargs.items()))
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)  # unhashable args: don't cache
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and now - hit[0] < wrapper.ttl:
+                    return copy.deepcopy(hit[1])
+                flight = inflight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = inflight[key] = Future()
+                    flight.leader = threading.get_ident()
+            if not leader:
+                if flight.leader == threading.get_ident():
+                    return func(*args, **kwargs)  # re-entrant: don't self-wait
+                # Another thread is already asking; wait for its reply, but
+                # no longer than one socket read, so a stalled leader can't
+                # hang every poller.  After that, ask the device ourselves.
+                try:
+                    value = flight.result(timeout=_Connection._READ_TIMEOUT)
+                except FuturesTimeoutError:
+                    return func(*args, **kwargs)
+                return copy.deepcopy(value)
+
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as exc:
+                with lock:
+                    if inflight.get(key) is flight:
+                        del inflight[key]
+                flight.set_exception(exc)
+                raise
+            with lock:
+                # Skip storing if cache_clear() ran while we were waiting.
+                if inflight.get(key) is flight:
+                    del inflight[key]
+                    if should_cache is None or should_cache(value):
+                        cache[key] = (now, value)
+            flight.set_result(value)
+            return copy.deepcopy(value)
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                inflight.clear()
+
+        wrapper.ttl = ttl
+        wrapper.cache_clear = cache_clear
+        _TTL_CACHE_CLEARERS.append(cache_clear)
+        return wrapper
+    return decorator
+
+
+# cache_clear() of every ttl_cache, so clear_ttl_caches() can run them all.
+_TTL_CACHE_CLEARERS = []
+
+
+def clear_ttl_caches():
+    """Drop all results cached by :func:`ttl_cache`-decorated queries."""
+    for cache_clear in _TTL_CACHE_CLEARERS:
+        cache_clear()
+
+
 def find_available_ips(n_ip, timeout=2):
     """
     Find all Seestars on the local network using parallel mDNS lookups.
@@ -261,6 +377,53 @@ def set_default_ip(n):
     print(f"DEFAULT_IP \u2192 {DEFAULT_IP} ({hostname})")
 
 
+def _dumps(obj):
+    """Encode *obj* as JSON bytes, using orjson when it is installed.
+
+    Falls back to the stdlib for anything orjson refuses (e.g. exotic
+    number types).  The wire bytes do depend on which encoder ran:
+    orjson omits the spaces after ``:`` and ``,``, and writes NaN and
+    ±inf as ``null`` where the stdlib writes ``NaN`` and ``Infinity``.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def _loads(data):
+    """Decode one JSON frame, using orjson when it is installed.
+
+    orjson's decode error subclasses :class:`json.JSONDecodeError`, so
+    callers catch the same exception either way.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _method_only_line(method, cmd_id):
+    """Encoded request line for a ``{"method": ...}``-only command.
+
+    Most getters send no params, so their wire bytes depend only on the
+    method name and id; cache them instead of re-encoding every call.
+    """
+    cmd = {"id": cmd_id, "verify": True, "method": method}
+    return _dumps(cmd) + b"\r\n"
+
+
+def _encode_command(params, cmd_id):
+    """Return the ``\r\n``-terminated wire bytes for one command."""
+    if len(params) == 1 and type(params.get("method")) is str:
+        return _method_only_line(params["method"], cmd_id)
+    cmd = {"id": cmd_id, "verify": True}
+    cmd.update(params)
+    return _dumps(cmd) + b"\r\n"
+
+
 class _Connection:
     """A persistent, authenticated JSON-RPC connection to one Seestar.
 
@@ -273,25 +436,31 @@ class _Connection:
     """
 
     _READ_TIMEOUT = 10
+    _RECV_SIZE = 65536
 
     def __init__(self, ip, port=DEFAULT_PORT):
         self.ip = ip
         self.port = port
         self._sock = None
-        self._buf = ""
+        self._buf = bytearray()
         self._lock = threading.Lock()
 
     # -- socket lifecycle ---------------------------------------------------
     def _connect(self):
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         s.settimeout(self._READ_TIMEOUT)
+        # Requests are small single writes awaiting a reply, so don't let
+        # Nagle hold them back; keepalive lets an idle pooled socket that
+        # the scope (or Wi-Fi) silently dropped be noticed.
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         s.connect((self.ip, self.port))
         # Authenticate if a key is configured (firmware 7.18+).
         from .auth import authenticate, KEY_PATH as _AUTH_KEY
         if _AUTH_KEY is not None:
             authenticate(s)
         self._sock = s
-        self._buf = ""
+        self._buf = bytearray()
 
     def _close_locked(self):
         if self._sock is not None:
@@ -300,47 +469,73 @@ class _Connection:
             except OSError:
                 pass
             self._sock = None
-        self._buf = ""
+        self._buf = bytearray()
 
     def close(self):
         with self._lock:
             self._close_locked()
 
-    # -- one request/reply round on the live socket -------------------------
-    def _send_once(self, cmd, cmd_id):
-        message = json.dumps(cmd) + "\r\n"
-        if VERBOSE_LEVEL >= 1:
-            print(f"\nSending: {message.strip()}")
-        self._sock.sendall(message.encode())
-
-        # Read frames until the one matching cmd_id.  The Seestar interleaves
-        # unsolicited events ("Event":"PiStatus", "temp", ...) onto the same
-        # socket, so skip anything that isn't our reply.
+    # -- request/reply rounds on the live socket ------------------------------
+    def _next_frame(self):
+        """Block until the next complete JSON frame arrives and return it."""
+        buf = self._buf
         while True:
-            while "\r\n" not in self._buf:
-                chunk = self._sock.recv(4096).decode("utf-8")
+            end = buf.find(b"\r\n")
+            while end < 0:
+                chunk = self._sock.recv(self._RECV_SIZE)
                 if not chunk:
                     # Peer closed the connection — signal a reconnect.
                     raise ConnectionError("Seestar closed the connection")
-                self._buf += chunk
-            line, self._buf = self._buf.split("\r\n", 1)
+                # Only the new bytes (plus one, for a split "\r\n") can
+                # hold the terminator, so don't rescan the whole buffer.
+                start = max(len(buf) - 1, 0)
+                buf += chunk
+                end = buf.find(b"\r\n", start)
+            line = bytes(buf[:end])
+            del buf[:end + 2]
             if not line:
                 continue
             try:
-                frame = json.loads(line)
-            except json.JSONDecodeError:
+                return _loads(line)
+            except ValueError:
+                # Malformed JSON or a non-UTF-8 line; skip it.
+                continue
+
+    def _send_once(self, lines, replies):
+        """Write every command in *lines* and collect the replies by id.
+
+        *lines* maps id -> encoded command line.  All commands go out in a
+        single ``sendall`` so a batch costs one round-trip rather than one
+        per command; matching replies are stored in *replies* as they arrive.
+        """
+        message = b"".join(lines.values())
+        if VERBOSE_LEVEL >= 1:
+            print(f"\nSending: {message.decode().strip()}")
+        self._sock.sendall(message)
+
+        # Read frames until every id is answered.  The Seestar interleaves
+        # unsolicited events ("Event":"PiStatus", "temp", ...) onto the same
+        # socket, so skip anything that isn't one of our replies.
+        pending = set(lines)
+        while pending:
+            frame = self._next_frame()
+            cmd_id = frame.get("id") if isinstance(frame, dict) else None
+            if cmd_id in pending:
+                pending.discard(cmd_id)
+                replies[cmd_id] = frame
                 continue
-            if isinstance(frame, dict) and frame.get("id") == cmd_id:
-                return frame
             if VERBOSE_LEVEL >= 2:
                 ev = frame.get("Event") or frame.get("method") \
                     if isinstance(frame, dict) else None
                 print(f"  (skipped event: {ev})")
 
     def send(self, params):
-        cmd_id = 1
-        cmd = {"id": cmd_id, "verify": True}
-        cmd.update(params)
+        return self.send_many([params])[0]
+
+    def send_many(self, params_list):
+        lines = {cmd_id: _encode_command(params, cmd_id)
+                 for cmd_id, params in enumerate(params_list, start=1)}
+        replies = {}
 
         with self._lock:
             last_exc = None
@@ -348,18 +543,16 @@ class _Connection:
                 try:
                     if self._sock is None:
                         self._connect()
-                    parsed = self._send_once(cmd, cmd_id)
+                    # On a retry, only resend what wasn't answered yet.
+                    self._send_once(
+                        {i: ln for i, ln in lines.items() if i not in replies},
+                        replies,
+                    )
                     if not PERSIST_CONNECTIONS:
                         self._close_locked()
-                    if VERBOSE_LEVEL >= 1:
-                        print(f"\nRecieved: {json.dumps(parsed)}")
-                    if VERBOSE_LEVEL >= 2:
-                        print("\n✅ Response:")
-                        print(f"  method: {parsed.get('method')}")
-                        print(f"  result: {json.dumps(parsed.get('result'), indent=2)}")
-                        print(f"  code  : {parsed.get('code')}")
-                        print(f"  error : {parsed.get('error')}")
-                    return parsed
+                    for parsed in replies.values():
+                        self._log_reply(parsed)
+                    return [replies[i] for i in lines]
                 except (OSError, ConnectionError) as exc:
                     # Socket dropped (or timed out) — discard it and, on the
                     # first attempt, reconnect + re-authenticate and retry.
@@ -372,6 +565,17 @@ class _Connection:
                 f"send_command to {self.ip} failed after reconnect: {last_exc}"
             )
 
+    @staticmethod
+    def _log_reply(parsed):
+        if VERBOSE_LEVEL >= 1:
+            print(f"\nRecieved: {json.dumps(parsed)}")
+        if VERBOSE_LEVEL >= 2:
+            print("\n✅ Response:")
+            print(f"  method: {parsed.get('method')}")
+            print(f"  result: {json.dumps(parsed.get('result'), indent=2)}")
+            print(f"  code  : {parsed.get('code')}")
+            print(f"  error : {parsed.get('error')}")
+
 
 # Pool of persistent connections keyed by IP.
 _connections = {}
@@ -445,3 +649,85 @@ def send_command(params):
 
     """
     return _get_connection(current_ip()).send(params)
+
+
+def send_commands(params_list):
+    """
+    Send several JSON-RPC commands to the Seestar in one round-trip.
+
+    Like :func:`send_command`, but all commands are written to the
+    persistent connection in a single send before any reply is read, and
+    each reply is matched back to its command by ``id``.  A sequence of K
+    independent commands therefore costs about one network round-trip
+    instead of K.
+
+    The commands are not atomic: the Seestar executes them in order but
+    one failing does not stop the others.  Only pipeline commands that
+    don't depend on each other's results.
+
+    Parameters
+    ----------
+    params_list : list of dict
+        Command dicts as accepted by :func:`send_command`.
+
+    Returns
+    -------
+    list of dict
+        The parsed replies, in the same order as *params_list*.
+
+    Raises
+    ------
+    ConnectionError
+        If the commands could not be delivered and answered even after one
+        reconnect attempt (only unanswered commands are resent).
+
+    Examples
+    --------
+
+        >>> from seestarpy.connection import send_commands
+        >>> send_commands([{"method": "get_device_state"},
+        ...                {"method": "iscope_get_app_state"}])
+        [{'jsonrpc': '2.0', ..., 'method': 'get_device_state', 'id': 1},
+         {'jsonrpc': '2.0', ..., 'method': 'iscope_get_app_state', 'id': 2}]
+
+    """
+    if not params_list:
+        return []
+    return _get_connection(current_ip()).send_many(params_list)
+
+
+async def send_command_async(params):
+    """
+    Awaitable version of :func:`send_command`.
+
+    Runs the blocking request on a worker thread so asyncio code can
+    overlap commands with other work, e.g. ``asyncio.gather`` over several
+    Seestars.  The target is resolved with :func:`current_ip` *before*
+    leaving the calling thread.
+
+    Commands to the same Seestar still share its one persistent connection
+    and are sent one after another; to overlap several commands to one
+    scope, pipeline them with :func:`send_commands` instead.
+
+    Parameters
+    ----------
+    params : dict
+        As for :func:`send_command`.
+
+    Returns
+    -------
+    dict
+        The parsed JSON-RPC response dictionary.
+
+    Examples
+    --------
+
+        >>> import asyncio
+        >>> from seestarpy.connection import send_command_async
+        >>> asyncio.run(send_command_async({"method": "test_connection"}))
+        {'jsonrpc': '2.0', ..., 'method': 'test_connection', 'result': 'ok',
+         'code': 0, 'id': 1}
+
+    """
+    conn = _get_connection(current_ip())
+    return await asyncio.to_thread(conn.send, params)
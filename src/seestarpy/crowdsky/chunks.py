@@ -66,6 +66,17 @@ _CROWDSKY_RE = CROWDSKY_RE
 _CROWDSKY_RE_LEGACY = CROWDSKY_RE_LEGACY
 
 
+def _parse_timestamp(ts):
+    """Turn a regex-validated ``YYYYMMDD-HHMMSS`` stamp into a datetime.
+
+    Slices the fixed-width digits directly instead of going through
+    ``datetime.strptime``, which re-parses the format string on every call
+    and dominates when scanning folders of thousands of sub-frames.
+    """
+    return datetime(int(ts[0:4]), int(ts[4:6]), int(ts[6:8]),
+                    int(ts[9:11]), int(ts[11:13]), int(ts[13:15]))
+
+
 def parse_light_filename(filename):
     """Parse a raw light frame filename into its components.
 
@@ -96,7 +107,7 @@ def parse_light_filename(filename):
         "target": m.group(1),
         "exposure": m.group(2),
         "filter": m.group(3),
-        "datetime": datetime.strptime(m.group(4), "%Y%m%d-%H%M%S"),
+        "datetime": _parse_timestamp(m.group(4)),
     }
 
 
@@ -117,9 +128,10 @@ def _read_fits_ra_dec(remote_path):
     """Read RA/Dec from a FITS header on the Seestar via HTTP Range request.
 
     Fetches the first 8 FITS header blocks (23040 bytes = 8 × 2880) and
-    parses 80-byte FITS cards for ``RA`` and ``DEC`` keywords.  Eight blocks
-    comfortably cover the Seestar's stack headers even if a future firmware
-    grows them past the two blocks the original implementation read.
+    scans the raw 80-byte FITS cards for ``RA`` and ``DEC`` keywords,
+    stopping at the ``END`` card.  Eight blocks comfortably cover the
+    Seestar's stack headers even if a future firmware grows them past the
+    two blocks the original implementation read.
 
     Parameters
     ----------
@@ -137,14 +149,16 @@ def _read_fits_ra_dec(remote_path):
         url = f"http://{connection.current_ip()}/{path}"
         req = urllib.request.Request(url, headers={"Range": "bytes=0-23039"})
         resp = urllib.request.urlopen(req, timeout=10)
-        header_bytes = resp.read().decode("ascii", errors="replace")
+        header_bytes = resp.read()
         ra = dec = None
         for i in range(0, len(header_bytes), 80):
             card = header_bytes[i : i + 80]
-            if card.startswith("RA      ="):
-                ra = float(card.split("=")[1].split("/")[0].strip())
-            elif card.startswith("DEC     ="):
-                dec = float(card.split("=")[1].split("/")[0].strip())
+            if card.startswith(b"RA      ="):
+                ra = float(card.split(b"=", 1)[1].split(b"/", 1)[0])
+            elif card.startswith(b"DEC     ="):
+                dec = float(card.split(b"=", 1)[1].split(b"/", 1)[0])
+            elif card.startswith(b"END "):
+                break
             if ra is not None and dec is not None:
                 return (ra, dec)
     except Exception:
@@ -346,7 +360,7 @@ def parse_coverage_from_filenames(filenames):
             continue
         m = CROWDSKY_RE_LEGACY.match(fname)
         if m:
-            dt = datetime.strptime(m.group(5), "%Y%m%d-%H%M%S")
+            dt = _parse_timestamp(m.group(5))
             covered.add((local_dt_to_chunk_str(dt), m.group(3), m.group(4)))
     return covered
 
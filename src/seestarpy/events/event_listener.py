@@ -5,10 +5,12 @@ import websockets
 import threading
 from pathlib import Path
 
-from ..connection import DEFAULT_IP, DEFAULT_PORT, VERBOSE_LEVEL
+from ..connection import DEFAULT_IP, DEFAULT_PORT, VERBOSE_LEVEL, _loads
 from .event_stream import handle_event, LATEST_STATE
 
 HEARTBEAT_INTERVAL = 3
+_READ_CHUNK = 65536  # bytes per reader.read() call
+_MAX_LINE = 65536  # longest frame kept while waiting for its \r\n
 _listener_running = False  # Prevent multiple starts
 _shutdown_event = None
 _listener_thread = None
@@ -54,6 +56,31 @@ async def heartbeat(writer):
         await asyncio.sleep(HEARTBEAT_INTERVAL)
 
 
+def _dispatch_line(line):
+    """Parse one ``\r\n``-stripped frame and pass it to :func:`handle_event`."""
+    if not line.strip():
+        return
+    try:
+        data = _loads(line)
+    except ValueError:  # bad JSON or bad UTF-8, from either decoder
+        if VERBOSE_LEVEL >= 1:
+            print("[non-json]", line.decode(errors="replace"))
+        return
+
+    # Treat responses to heartbeat as events
+    if "result" in data:
+        method_name = data.get("method")
+        if method_name:
+            data["Event"] = method_name
+
+    handle_event(data)
+
+    # Per-event echo is debug output: at level 1 it would print several
+    # lines a second from the read loop (heartbeat replies included).
+    if VERBOSE_LEVEL >= 2:
+        print("[event]", data)
+
+
 async def run():
     """
     Main event loop: connect to the Seestar and process incoming events.
@@ -77,32 +104,46 @@ async def run():
 
             hb_task = asyncio.create_task(heartbeat(writer))
 
+            # Read whatever the socket has and split it into \r\n frames
+            # ourselves: a burst of events costs one read() and one buffer
+            # trim, rather than a readuntil() copy per event.
+            # A frame longer than _MAX_LINE is dropped, and so is the rest
+            # of it up to the next \r\n, so a peer that never terminates a
+            # line can't grow the buffer without bound.
+            buf = bytearray()
+            skipping = False
             while not _shutdown_event.is_set():
                 try:
-                    line = await asyncio.wait_for(
-                        reader.readuntil(separator=b"\r\n"),
+                    chunk = await asyncio.wait_for(
+                        reader.read(_READ_CHUNK),
                         timeout=2.0,
                     )
                 except asyncio.TimeoutError:
                     continue
-
-                message = line.decode().strip()
-                try:
-                    data = json.loads(message)
-
-                    # Treat responses to heartbeat as events
-                    if "result" in data:
-                        method_name = data.get("method")
-                        if method_name:
-                            data["Event"] = method_name
-
-                    handle_event(data)
-
-                    if VERBOSE_LEVEL >= 1:
-                        print("[event]", data)
-                except json.JSONDecodeError:
+                if not chunk:
+                    raise asyncio.IncompleteReadError(bytes(buf), None)
+
+                buf += chunk
+                start = 0
+                if skipping:
+                    end = buf.find(b"\r\n")
+                    if end == -1:
+                        # Keep a trailing \r in case its \n is next.
+                        del buf[:len(buf) - buf.endswith(b"\r")]
+                        continue
+                    start = end + 2
+                    skipping = False
+                while (end := buf.find(b"\r\n", start)) != -1:
+                    _dispatch_line(bytes(buf[start:end]))
+                    start = end + 2
+                if start:
+                    del buf[:start]
+                if len(buf) > _MAX_LINE:
                     if VERBOSE_LEVEL >= 1:
-                        print("[non-json]", message)
+                        print(f"[oversized] dropping a frame over "
+                              f"{_MAX_LINE} bytes")
+                    del buf[:len(buf) - buf.endswith(b"\r")]
+                    skipping = True
 
         except asyncio.CancelledError:
             break
@@ -134,8 +175,8 @@ async def websocket_server():
     Start a WebSocket server that broadcasts :data:`event_stream.LATEST_STATE`.
 
     Serves on ``ws://0.0.0.0:8765``.  Each connected client receives the
-    full state dictionary once per second.  Used by the HTML dashboards
-    returned by :func:`dashboard_url`.
+    full state dictionary once per second, uncompressed.  Used by the HTML
+    dashboards returned by :func:`dashboard_url`.
     """
     async def handler(websocket):
         connected_clients.add(websocket)
@@ -148,7 +189,10 @@ async def websocket_server():
         finally:
             connected_clients.remove(websocket)
 
-    server = await websockets.serve(handler, "0.0.0.0", 8765)
+    # The state dump goes out once a second to dashboards that are almost
+    # always on the same machine, so permessage-deflate only burns CPU.
+    server = await websockets.serve(handler, "0.0.0.0", 8765,
+                                    compression=None, max_size=2**20)
     print("[websocket] Serving on ws://0.0.0.0:8765")
     while not _shutdown_event.is_set():
         await asyncio.sleep(1)
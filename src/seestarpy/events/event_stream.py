@@ -12,7 +12,7 @@ LATEST_STATE = {}
 LATEST_LOGS = deque(maxlen=500)
 
 
-def handle_event(data: dict):
+def handle_event(data: dict, _state=LATEST_STATE, _logs=LATEST_LOGS):
     """
     Route an incoming Seestar event into the shared state stores.
 
@@ -27,8 +27,16 @@ def handle_event(data: dict):
         A JSON-parsed Seestar message that must contain an ``"Event"``
         key to be stored.  Messages without an ``"Event"`` key are
         silently ignored.
+
+    Notes
+    -----
+    This runs once per incoming message, so the two stores are bound as
+    default arguments (local lookups) rather than read as module globals.
+    They are never meant to be passed by callers.
     """
+    if not data:
+        return
     event_type = data.get("Event")
     if event_type:
-        LATEST_STATE[event_type] = data
-        LATEST_LOGS.append(data)
+        _state[event_type] = data
+        _logs.append(data)
@@ -1,10 +1,20 @@
 import asyncio
 import json
 import time
-from typing import List, Type
+from dataclasses import fields, is_dataclass
+from typing import List
 
-from src.seestarpy.connection import DEFAULT_IP, DEFAULT_PORT, VERBOSE_LEVEL
-from src.seestarpy.events import event_definitions as evs
+from ..connection import DEFAULT_IP, DEFAULT_PORT, VERBOSE_LEVEL
+from . import event_definitions as evs
+
+# Event name -> (dataclass, accepted field names), built once at import so
+# _handle_event is a dict lookup instead of getattr() on the module.
+_EVENT_CLASSES = {
+    cls.__name__: (cls, frozenset(f.name for f in fields(cls)))
+    for cls in vars(evs).values()
+    if isinstance(cls, type) and is_dataclass(cls)
+}
+_EVENT_CLASSES["3PPA"] = _EVENT_CLASSES["ThreePPA"]
 
 
 class EventWatcher:
@@ -22,7 +32,8 @@ class EventWatcher:
         event loop.  For most use cases, prefer :func:`start_listener`.
     """
     def __init__(self):
-        self.events_list: List[evs.Event] = []
+        self.events_list: List[object] = []
+        self._events_by_type = {}
         self._task = asyncio.create_task(self._listen())
 
     async def _heartbeat(self, writer):
@@ -70,17 +81,23 @@ class EventWatcher:
             await asyncio.sleep(3)
 
     def _handle_event(self, data: dict):
-        event_type = data.get("Event")
-        if event_type is None:
-            return
+        entry = _EVENT_CLASSES.get(data.get("Event"))
+        if entry is None:
+            return  # no Event key, or a type this firmware added since
+        ev_class, names = entry
+        kwargs = {k: v for k, v in data.items() if k in names}
 
-        for evt in self.events_list:
-            if evt.__class__.__name__ == event_type:
-                evt.update(json.dumps(data))
-                return
+        evt = self._events_by_type.get(ev_class)
+        if evt is not None:
+            for key, value in kwargs.items():
+                setattr(evt, key, value)
+            return
 
-        ev_class = getattr(evs, event_type)
-        new_event = ev_class(**json.dumps(data))
+        try:
+            new_event = ev_class(**kwargs)
+        except TypeError:
+            return  # first message lacks a required field
+        self._events_by_type[ev_class] = new_event
         self.events_list.append(new_event)
         if VERBOSE_LEVEL >= 1:
             print(f"[event_watcher] New event stored: {new_event.__class__.__name__}")
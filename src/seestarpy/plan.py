@@ -2,16 +2,71 @@ import math
 import random
 import warnings
 import xml.etree.ElementTree as _ET
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
 from urllib.parse import quote as _url_quote
 
 import requests as _requests
 
-from .connection import send_command
-from .raw import iscope_get_app_state
+from .connection import send_command, ttl_cache
+from .raw import _is_ok_reply, iscope_get_app_state
+from .status import invalidate_mount_state
 
 _N_EDGE_POINTS = 50
 
+# Constant request for stop_view_plan(); send_command never mutates params.
+_STOP_VIEW_PLAN_PARAMS = {'method': 'stop_func', 'params': {'name': 'ViewPlan'}}
+
+
+@dataclass(slots=True, frozen=True)
+class Target:
+    """
+    One pointing in an observation plan.
+
+    A compact, immutable alternative to the plain target dicts accepted by
+    :func:`set_view_plan`; the two can be mixed in a plan's ``list``.
+    Fields mirror the target dict keys documented there.
+
+    Examples
+    --------
+    ::
+
+        >>> from seestarpy import plan
+        >>> m42 = plan.Target(123456789, "M42", (5.588, -5.39),
+        ...                   start_min=1350, duration_min=30,
+        ...                   alias_name="Orion Nebula", lp_filter=True)
+        >>> plan.set_view_plan({"plan_name": "Evening Session",
+        ...                     "update_time_seestar": "2026.02.23",
+        ...                     "list": [m42]})
+
+    """
+    target_id: int
+    target_name: str
+    target_ra_dec: tuple
+    start_min: int
+    duration_min: int
+    alias_name: str = ""
+    lp_filter: bool = False
+
+    def to_dict(self):
+        """Return the target as the dict :func:`set_view_plan` sends."""
+        return {
+            "target_id": self.target_id,
+            "target_name": self.target_name,
+            "alias_name": self.alias_name,
+            "target_ra_dec": list(self.target_ra_dec),
+            "lp_filter": self.lp_filter,
+            "start_min": self.start_min,
+            "duration_min": self.duration_min,
+        }
+
+
+@ttl_cache(0.25, should_cache=_is_ok_reply)
+def _app_state_reply():
+    """``iscope_get_app_state`` reply behind :func:`get_running_plan`."""
+    return iscope_get_app_state()
+
 
 def get_running_plan():
     """
@@ -21,6 +76,12 @@ def get_running_plan():
     This queries ``iscope_get_app_state`` and extracts the ``ViewPlan``
     key, which is how the official Seestar app checks plan status.
 
+    The app state is cached for ``get_running_plan.ttl`` seconds (0.25 by
+    default) so polling loops don't re-fetch it on every call; an error
+    reply is not cached, so a failed poll isn't mistaken for "no plan"
+    for the whole ttl.  :func:`set_view_plan` and :func:`stop_view_plan`
+    clear the cache.  Set ``plan.get_running_plan.ttl = 0`` to disable it.
+
     .. note:: Confirmed via traffic capture from the official Seestar app
        v3.0.2 on 2026-02-24.
 
@@ -44,11 +105,14 @@ def get_running_plan():
         ...     print(f"Running: {vp['plan']['plan_name']}")
 
     """
-    resp = iscope_get_app_state()
-    result = resp.get("result")
-    if isinstance(result, dict):
-        return result.get("ViewPlan")
-    return None
+    _app_state_reply.ttl = get_running_plan.ttl
+    result = _app_state_reply().get("result")
+    return result.get("ViewPlan") if type(result) is dict else None
+
+
+# Tune and clear the cache through the public function.
+get_running_plan.ttl = _app_state_reply.ttl
+get_running_plan.cache_clear = _app_state_reply.cache_clear
 
 
 def set_view_plan(plan):
@@ -60,7 +124,8 @@ def set_view_plan(plan):
     plan : dict
         A plan dictionary with keys ``plan_name`` (str),
         ``update_time_seestar`` (str, format ``"yyyy.MM.dd"``), and
-        ``list`` (list of target dicts).  Each target dict has:
+        ``list`` (list of target dicts or :class:`Target` objects).  Each
+        target dict has:
 
         - ``target_id`` (int): 9-digit unique identifier.
         - ``target_name`` (str): Display name (e.g. ``"M 31"``).
@@ -75,6 +140,14 @@ def set_view_plan(plan):
     -------
     dict
 
+    Raises
+    ------
+    ValueError
+        If a target has no ``[ra, dec]`` pair, or its RA is outside
+        [0, 24) or its Dec outside [-90, 90].
+        Checked before anything is sent, so a bad plan never reaches the
+        Seestar.
+
     Notes
     -----
     .. note:: Payload format confirmed via traffic capture from the
@@ -132,8 +205,34 @@ def set_view_plan(plan):
         >>> plan.set_view_plan(my_plan)
 
     """
+    targets = plan.get("list", ())
+    _validate_ra_dec(targets)
+    if any(isinstance(t, Target) for t in targets):
+        # Don't mutate the caller's plan; send dicts on the wire.
+        plan = {**plan, "list": [t.to_dict() if isinstance(t, Target) else t
+                                 for t in targets]}
     params = {'method': 'set_view_plan', 'params': plan}
-    return send_command(params)
+    reply = send_command(params)
+    get_running_plan.cache_clear()  # clear after, so no poll re-caches old state
+    invalidate_mount_state()        # the plan slews to its first target
+    return reply
+
+
+def _validate_ra_dec(targets):
+    """Raise ValueError if any target's ``target_ra_dec`` is missing or out of range."""
+    for i, t in enumerate(targets):
+        ra_dec = t.target_ra_dec if isinstance(t, Target) else t.get("target_ra_dec")
+        try:
+            ra, dec = ra_dec
+            ra, dec = float(ra), float(dec)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Target {i}: target_ra_dec must be an [ra, dec] pair, "
+                f"got {ra_dec!r}") from None
+        if not 0 <= ra < 24:
+            raise ValueError(f"Target {i}: RA must be in [0, 24), got {ra}")
+        if not -90 <= dec <= 90:
+            raise ValueError(f"Target {i}: Dec must be in [-90, 90], got {dec}")
 
 
 def stop_view_plan():
@@ -158,16 +257,53 @@ def stop_view_plan():
         >>> plan.stop_view_plan()
 
     """
-    params = {'method': 'stop_func', 'params': {'name': 'ViewPlan'}}
-    return send_command(params)
+    reply = send_command(_STOP_VIEW_PLAN_PARAMS)
+    get_running_plan.cache_clear()
+    invalidate_mount_state()
+    return reply
 
 
 def _generate_target_ids(n):
     """Return *n* unique random 9-digit integers for use as target IDs."""
-    ids = set()
-    while len(ids) < n:
-        ids.add(random.randint(100_000_000, 999_999_999))
-    return list(ids)
+    return random.sample(range(100_000_000, 1_000_000_000), n)
+
+
+def _today_str():
+    """Return today's local date as ``"yyyy.MM.dd"`` for ``update_time_seestar``."""
+    return _format_day(date.today().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _format_day(ordinal):
+    return date.fromordinal(ordinal).strftime("%Y.%m.%d")
+
+
+def _wrap_ra(ra_hours):
+    """Wrap an RA in hours into [0, 24).
+
+    A tiny negative value (float rounding just west of 0h) wraps to exactly
+    24.0 under ``%``, which set_view_plan rejects; snap it back to 0.
+    """
+    ra_hours = ra_hours % 24.0
+    return 0.0 if ra_hours >= 24.0 else ra_hours
+
+
+def _panel_template(lp_filter, duration_min):
+    """Return a target dict with the fields shared by every mosaic panel.
+
+    Panel loops ``copy()`` this and fill in the per-panel fields, which is
+    cheaper than building a fresh seven-key literal for each panel and
+    keeps the key order :func:`set_view_plan` documents.
+    """
+    return {
+        "target_id": None,
+        "target_name": None,
+        "alias_name": "",
+        "target_ra_dec": None,
+        "lp_filter": lp_filter,
+        "start_min": None,
+        "duration_min": duration_min,
+    }
 
 
 def create_mosaic_plan(
@@ -306,25 +442,26 @@ def create_mosaic_plan(
     targets = []
     panel_num = 0
 
+    # Column RAs and the reversed (odd-row) order are the same for every
+    # row, so compute them once rather than per panel.
+    ra_values = [_wrap_ra(center_ra + ra_off) for ra_off in ra_offsets]
+    ra_rows = (ra_values, ra_values[::-1])
+    template = _panel_template(lp_filter, duration_per_panel)
+
     for j, dec_off in enumerate(dec_offsets):
-        ra_order = ra_offsets if j % 2 == 0 else list(reversed(ra_offsets))
-        for ra_off in ra_order:
-            ra = (center_ra + ra_off) % 24.0
-            dec = center_dec + dec_off
-            targets.append({
-                "target_id": target_ids[panel_num],
-                "target_name": f"{target_name_prefix}_{panel_num + 1:02d}",
-                "alias_name": "",
-                "target_ra_dec": [ra, dec],
-                "lp_filter": lp_filter,
-                "start_min": start_min + panel_num * duration_per_panel,
-                "duration_min": duration_per_panel,
-            })
+        dec = center_dec + dec_off
+        for ra in ra_rows[j % 2]:
+            target = template.copy()
+            target["target_id"] = target_ids[panel_num]
+            target["target_name"] = f"{target_name_prefix}_{panel_num + 1:02d}"
+            target["target_ra_dec"] = [ra, dec]
+            target["start_min"] = start_min + panel_num * duration_per_panel
+            targets.append(target)
             panel_num += 1
 
     return {
         "plan_name": plan_name,
-        "update_time_seestar": datetime.now().strftime("%Y.%m.%d"),
+        "update_time_seestar": _today_str(),
         "list": targets,
     }
 
@@ -622,7 +759,7 @@ def create_polygon_plan(
         ra_rad, dec_rad = _gnomonic_inverse(xi, eta, ra0, dec0)
         ra_hours = math.degrees(ra_rad) / 15.0
         dec_deg = math.degrees(dec_rad)
-        ra_hours = ra_hours % 24.0
+        ra_hours = _wrap_ra(ra_hours)
         sky_points.append((ra_hours, dec_deg, row, col))
 
     # --- Step 6: Boustrophedon ordering ---
@@ -644,20 +781,18 @@ def create_polygon_plan(
     target_ids = _generate_target_ids(n_panels)
     targets = []
 
+    template = _panel_template(lp_filter, duration_per_panel)
     for panel_num, (ra_h, dec_d) in enumerate(ordered):
-        targets.append({
-            "target_id": target_ids[panel_num],
-            "target_name": f"{target_name_prefix}_{panel_num + 1:02d}",
-            "alias_name": "",
-            "target_ra_dec": [ra_h, dec_d],
-            "lp_filter": lp_filter,
-            "start_min": start_min + panel_num * duration_per_panel,
-            "duration_min": duration_per_panel,
-        })
+        target = template.copy()
+        target["target_id"] = target_ids[panel_num]
+        target["target_name"] = f"{target_name_prefix}_{panel_num + 1:02d}"
+        target["target_ra_dec"] = [ra_h, dec_d]
+        target["start_min"] = start_min + panel_num * duration_per_panel
+        targets.append(target)
 
     return {
         "plan_name": plan_name,
-        "update_time_seestar": datetime.now().strftime("%Y.%m.%d"),
+        "update_time_seestar": _today_str(),
         "list": targets,
     }
 
@@ -891,7 +1026,7 @@ def create_named_plan(
 
     return {
         "plan_name": plan_name,
-        "update_time_seestar": datetime.now().strftime("%Y.%m.%d"),
+        "update_time_seestar": _today_str(),
         "list": plan_targets,
     }
 
@@ -927,7 +1062,8 @@ def _nice_grid_step(extent_deg):
     return 90
 
 
-def plot_mosaic_plan(plan, fov_width=0.75, fov_height=1.33, ax=None):
+def plot_mosaic_plan(plan, fov_width=0.75, fov_height=1.33, ax=None,
+                     labels=True):
     """
     Plot panel borders of a mosaic plan on a Mollweide projection.
 
@@ -956,6 +1092,10 @@ def plot_mosaic_plan(plan, fov_width=0.75, fov_height=1.33, ax=None):
     ax : matplotlib.axes.Axes or None, optional
         A rectilinear axes to plot on.  If ``None``, a new figure and
         axes are created.
+    labels : bool, optional
+        Write each panel's ``target_name`` at its centre.  Default is
+        ``True``; turn off for very large mosaics where the labels
+        overlap anyway.
 
     Returns
     -------
@@ -977,21 +1117,17 @@ def plot_mosaic_plan(plan, fov_width=0.75, fov_height=1.33, ax=None):
     import numpy as np
 
     # --- Collect panel extents in RA/Dec ---
-    ra_edges = []
-    dec_edges = []
-    panels_info = []
-
-    for target in plan["list"]:
-        ra_h, dec_d = target["target_ra_dec"]
-        cos_dec = math.cos(math.radians(dec_d))
-        half_dec = fov_height / 2.0
-        half_ra = fov_width / (2.0 * 15.0 * cos_dec)
-        ra_edges.extend([ra_h - half_ra, ra_h + half_ra])
-        dec_edges.extend([dec_d - half_dec, dec_d + half_dec])
-        panels_info.append((ra_h, dec_d, half_ra, half_dec, target["target_name"]))
-
-    ra_lo, ra_hi = min(ra_edges), max(ra_edges)
-    dec_lo, dec_hi = min(dec_edges), max(dec_edges)
+    # One pass over the target dicts into column arrays; everything after
+    # this works on whole arrays rather than per panel.
+    targets = plan["list"]
+    names = [t["target_name"] for t in targets]
+    ra_dec = np.array([t["target_ra_dec"] for t in targets], dtype=float)
+    ra_c, dec_c = ra_dec[:, 0], ra_dec[:, 1]
+    half_dec = fov_height / 2.0
+    half_ra = fov_width / (2.0 * 15.0 * np.cos(np.radians(dec_c)))
+
+    ra_lo, ra_hi = float((ra_c - half_ra).min()), float((ra_c + half_ra).max())
+    dec_lo, dec_hi = float(dec_c.min()) - half_dec, float(dec_c.max()) + half_dec
 
     # Expand to 150% of area (sqrt(1.5) per linear dimension)
     scale = math.sqrt(1.5)
@@ -1045,38 +1181,28 @@ def plot_mosaic_plan(plan, fov_width=0.75, fov_height=1.33, ax=None):
         ax.plot(gx, gy, color="gray", linewidth=0.4, alpha=0.5, zorder=1)
 
     # --- Panel outlines ---
+    # Perimeter of the square [-1, 1]^2 (bottom, right, top, left edges),
+    # built once and scaled/shifted onto each panel.
     n = _N_EDGE_POINTS
-    for ra_h, dec_d, half_ra, half_dec, name in panels_info:
-        ra_l, ra_r = ra_h - half_ra, ra_h + half_ra
-        dec_b, dec_t = dec_d - half_dec, dec_d + half_dec
-
-        ra_pts = np.concatenate([
-            np.linspace(ra_l, ra_r, n),
-            np.full(n, ra_r),
-            np.linspace(ra_r, ra_l, n),
-            np.full(n, ra_l),
-        ])
-        dec_pts = np.concatenate([
-            np.full(n, dec_b),
-            np.linspace(dec_b, dec_t, n),
-            np.full(n, dec_t),
-            np.linspace(dec_t, dec_b, n),
-        ])
-
-        x, y = _mollweide_xy(
-            -np.radians(ra_pts * 15 - 180),
-            np.radians(dec_pts),
-        )
-        ax.plot(x, y, "-", linewidth=0.8, zorder=2)
-
-        cx, cy = _mollweide_xy(
-            np.array([-math.radians(ra_h * 15 - 180)]),
-            np.array([math.radians(dec_d)]),
-        )
-        ax.text(
-            cx[0], cy[0], name,
-            fontsize=6, ha="center", va="center", zorder=3,
-        )
+    ramp = np.linspace(-1.0, 1.0, n)
+    edge_u = np.concatenate([ramp, np.ones(n), ramp[::-1], -np.ones(n)])
+    edge_v = np.concatenate([-np.ones(n), ramp, np.ones(n), ramp[::-1]])
+
+    # Project every panel in one call and draw them in one ax.plot() call
+    # (one column per panel), which takes each panel's colour from this
+    # axes' own property cycle.
+    ra_pts = ra_c[:, None] + half_ra[:, None] * edge_u
+    dec_pts = dec_c[:, None] + half_dec * edge_v
+    x, y = _mollweide_xy(-np.radians(ra_pts * 15 - 180), np.radians(dec_pts))
+    ax.plot(x.T, y.T, linewidth=0.8, zorder=2)
+
+    if labels:
+        cx, cy = _mollweide_xy(-np.radians(ra_c * 15 - 180), np.radians(dec_c))
+        for px, py, name in zip(cx, cy, names):
+            ax.text(
+                px, py, name,
+                fontsize=6, ha="center", va="center", zorder=3,
+            )
 
     # --- View limits ---
     corners_ra = np.array([view_ra[0], view_ra[1], view_ra[0], view_ra[1]])
@@ -1,6 +1,6 @@
 import functools
+import time
 import warnings
-from datetime import datetime
 
 from tzlocal import get_localzone_name  # pip install tzlocal
 
@@ -19,7 +19,38 @@ def _deprecated(since, message=""):
         return wrapper
     return decorator
 
-from .connection import send_command, multiple_ips
+from .connection import (send_command, send_commands, multiple_ips,
+                         ttl_cache, clear_ttl_caches)
+
+
+# Shared ``{"method": ...}`` payloads for the argument-less getters, built
+# once per method.  send_command never mutates its argument.
+_METHOD_ONLY = {}
+
+
+def _rpc(method, params=None):
+    """Send *method* (with *params*, if given) to the current Seestar."""
+    if params is None:
+        cmd = _METHOD_ONLY.get(method)
+        if cmd is None:
+            cmd = _METHOD_ONLY[method] = {"method": method}
+        return send_command(cmd)
+    return send_command({"method": method, "params": params})
+
+
+def _is_ok_reply(reply):
+    """True for a successful device reply, or an IP-keyed dict of them."""
+    if not isinstance(reply, dict) or not reply:
+        return False
+    if not reply.keys().isdisjoint(("id", "result", "code", "error")):
+        return reply.get("code", 0) == 0 and "error" not in reply
+    return all(_is_ok_reply(r) for r in reply.values())   # multiple_ips
+
+
+def _mount_state_changed():
+    """Drop the cached mount state after a command that moves the mount."""
+    from .status import invalidate_mount_state  # status imports raw
+    invalidate_mount_state()
 
 """
 To implement:
@@ -55,6 +86,7 @@ To implement:
 #     return send_command(params)
 
 
+@ttl_cache(10, should_cache=_is_ok_reply)
 @multiple_ips
 def get_albums():
     """
@@ -103,10 +135,13 @@ def get_albums():
 
     Notes
     -----
+    Successful replies are cached per Seestar for 10 s (see
+    :func:`~seestarpy.connection.ttl_cache`); call
+    :func:`invalidate_all_caches` to force a fresh query.
+
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'get_albums'}
-    return send_command(params)
+    return _rpc("get_albums")
 
 
 @multiple_ips
@@ -142,9 +177,8 @@ def get_img_file_page_number(directory, skip_avi=False):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_img_file_page_number",
-              "params": {"dir": directory, "skip_avi": skip_avi}}
-    return send_command(params)
+    return _rpc("get_img_file_page_number",
+                {"dir": directory, "skip_avi": skip_avi})
 
 
 @multiple_ips
@@ -184,9 +218,7 @@ def get_img_file_page_name(page=0):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_img_file_page_name",
-              "params": {"page": page}}
-    return send_command(params)
+    return _rpc("get_img_file_page_name", {"page": page})
 
 
 # def get_annotated_result():
@@ -238,8 +270,7 @@ def get_camera_info():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_camera_info"}
-    return send_command(params)
+    return _rpc("get_camera_info")
 
 
 @multiple_ips
@@ -270,8 +301,7 @@ def get_camera_state():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_camera_state"}
-    return send_command(params)
+    return _rpc("get_camera_state")
 
 
 @multiple_ips
@@ -460,9 +490,7 @@ def get_device_state(keys=None):
     """
     if keys is None:
         keys = []
-    params = {"method": "get_device_state",
-              "params": {"keys": keys}}
-    return send_command(params)
+    return _rpc("get_device_state", {"keys": keys})
 
 
 @multiple_ips
@@ -490,8 +518,7 @@ def get_disk_volume():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_disk_volume"}
-    return send_command(params)
+    return _rpc("get_disk_volume")
 
 
 # def get_event_state():
@@ -535,8 +562,7 @@ def get_focuser_position():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_focuser_position"}
-    return send_command(params)
+    return _rpc("get_focuser_position")
 
 
 @multiple_ips
@@ -565,8 +591,7 @@ def get_last_solve_result():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_last_solve_result"}
-    return send_command(params)
+    return _rpc("get_last_solve_result")
 
 
 @multiple_ips
@@ -595,8 +620,7 @@ def get_solve_result():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_solve_result"}
-    return send_command(params)
+    return _rpc("get_solve_result")
 
 
 @multiple_ips
@@ -612,8 +636,7 @@ def get_stacked_img():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_stacked_img"}
-    return send_command(params)
+    return _rpc("get_stacked_img")
 
 
 @multiple_ips
@@ -650,8 +673,7 @@ def get_stack_setting():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_stack_setting"}
-    return send_command(params)
+    return _rpc("get_stack_setting")
 
 
 @multiple_ips
@@ -680,10 +702,10 @@ def get_stack_info():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_stack_info"}
-    return send_command(params)
+    return _rpc("get_stack_info")
 
 
+@ttl_cache(300, should_cache=_is_ok_reply)
 @multiple_ips
 def get_sensor_calibration():
     """
@@ -720,10 +742,13 @@ def get_sensor_calibration():
 
     Notes
     -----
+    Successful replies are cached per Seestar for 300 s (see
+    :func:`~seestarpy.connection.ttl_cache`); call
+    :func:`invalidate_all_caches` to force a fresh query.
+
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_sensor_calibration"}
-    return send_command(params)
+    return _rpc("get_sensor_calibration")
 
 
 @multiple_ips
@@ -785,10 +810,10 @@ def get_setting():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_setting"}
-    return send_command(params)
+    return _rpc("get_setting")
 
 
+@ttl_cache(300, should_cache=_is_ok_reply)
 @multiple_ips
 def get_user_location():
     """
@@ -812,10 +837,13 @@ def get_user_location():
 
     Notes
     -----
+    Successful replies are cached per Seestar for 300 s (see
+    :func:`~seestarpy.connection.ttl_cache`); call
+    :func:`invalidate_all_caches` to force a fresh query.
+
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'get_user_location'}
-    return send_command(params)
+    return _rpc("get_user_location")
 
 
 @multiple_ips
@@ -855,8 +883,7 @@ def get_view_state():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_view_state"}
-    return send_command(params)
+    return _rpc("get_view_state")
 
 
 @multiple_ips
@@ -872,8 +899,7 @@ def get_wheel_position():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_wheel_position"}
-    return send_command(params)
+    return _rpc("get_wheel_position")
 
 
 @multiple_ips
@@ -889,8 +915,7 @@ def get_wheel_setting():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "get_wheel_setting"}
-    return send_command(params)
+    return _rpc("get_wheel_setting")
 
 
 @multiple_ips
@@ -906,8 +931,7 @@ def iscope_get_app_state():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "iscope_get_app_state"}
-    return send_command(params)
+    return _rpc("iscope_get_app_state")
 
 
 @multiple_ips
@@ -983,7 +1007,9 @@ def iscope_start_view(ra=None, dec=None,
     if mosaic is not None and isinstance(mosaic, dict):
         params["params"]["mosaic"] = mosaic
 
-    return send_command(params)
+    reply = send_command(params)
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1046,9 +1072,9 @@ def iscope_stop_view(stage=None):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "iscope_stop_view",
-              "params": {"stage": stage}}
-    return send_command(params)
+    reply = _rpc("iscope_stop_view", {"stage": stage})
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1069,10 +1095,7 @@ def iscope_start_stack(restart=False):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "iscope_start_stack",
-              "params": {"restart": restart}
-              }
-    return send_command(params)
+    return _rpc("iscope_start_stack", {"restart": restart})
 
 
 @multiple_ips
@@ -1102,11 +1125,8 @@ def move_focuser(pos, retry=True):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "move_focuser",
-              "params": {"step": pos,
-                         "ret_step": retry}
-              }
-    return send_command(params)
+    return _rpc("move_focuser", {"step": pos,
+                                 "ret_step": retry})
 
 
 @multiple_ips
@@ -1132,8 +1152,7 @@ def pi_get_time():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'pi_get_time'}
-    return send_command(params)
+    return _rpc("pi_get_time")
 
 
 @multiple_ips
@@ -1170,20 +1189,17 @@ def pi_set_time(time_zone=None):
     if time_zone is None:
         time_zone = get_localzone_name()
 
-    now = datetime.now()
-    print(now)
+    now = time.localtime()
     date_json = {
-        "year": now.year,
-        "mon": now.month,
-        "day": now.day,
-        "hour": now.hour,
-        "min": now.minute,
-        "sec": now.second,
+        "year": now.tm_year,
+        "mon": now.tm_mon,
+        "day": now.tm_mday,
+        "hour": now.tm_hour,
+        "min": now.tm_min,
+        "sec": now.tm_sec,
         "time_zone": time_zone
     }
-    params = {'method': 'pi_set_time',
-              'params': [date_json]}
-    return send_command(params)
+    return _rpc("pi_set_time", [date_json])
 
 
 
@@ -1203,8 +1219,7 @@ def pi_reboot():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'pi_reboot'}
-    return send_command(params)
+    return _rpc("pi_reboot")
 
 
 @multiple_ips
@@ -1233,10 +1248,10 @@ def pi_shutdown(force=False):
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
 
-    params = {'method': 'pi_shutdown'}
-    return send_command(params) if force else "Are you sure you want to shutdown? Then use force=True"
+    return _rpc("pi_shutdown") if force else "Are you sure you want to shutdown? Then use force=True"
 
 
+@ttl_cache(300, should_cache=_is_ok_reply)
 @multiple_ips
 def pi_is_verified():
     """
@@ -1248,10 +1263,13 @@ def pi_is_verified():
 
     Notes
     -----
+    Successful replies are cached per Seestar for 300 s (see
+    :func:`~seestarpy.connection.ttl_cache`); call
+    :func:`invalidate_all_caches` to force a fresh query.
+
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'pi_is_verified'}
-    return send_command(params)
+    return _rpc("pi_is_verified")
 
 
 @multiple_ips
@@ -1275,12 +1293,8 @@ def pi_output_set2(is_dew_on=False, dew_heater_power=0):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'pi_output_set2',
-              "params": {"heater": {"state": is_dew_on,
-                                    "value": dew_heater_power}
-                         }
-              }
-    return send_command(params)
+    return _rpc("pi_output_set2", {"heater": {"state": is_dew_on,
+                                              "value": dew_heater_power}})
 
 
 @multiple_ips
@@ -1296,8 +1310,7 @@ def scan_iscope():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "scan_iscope"}
-    return send_command(params)
+    return _rpc("scan_iscope")
 
 
 @multiple_ips
@@ -1325,8 +1338,7 @@ def play_sound(sound_id):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'play_sound', 'params': {"num": sound_id}}
-    return send_command(params)
+    return _rpc("play_sound", {"num": sound_id})
 
 
 @multiple_ips
@@ -1376,8 +1388,7 @@ def set_control_value(gain=80):
 
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "set_control_value", "params": ["gain", gain]}
-    return send_command(params)
+    return _rpc("set_control_value", ["gain", gain])
 
 
 @multiple_ips
@@ -1500,8 +1511,7 @@ def set_setting(**kwargs):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "set_setting", "params": kwargs}
-    return send_command(params)
+    return _rpc("set_setting", kwargs)
 
 
 @multiple_ips
@@ -1528,12 +1538,9 @@ def set_stack_setting(save_ok_frames=True, save_rejected_frames=False):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "set_stack_setting",
-              "params": {"save_discrete_ok_frame": save_ok_frames,
-                         "save_discrete_frame": save_rejected_frames
-                         }
-              }
-    return send_command(params)
+    return _rpc("set_stack_setting",
+                {"save_discrete_ok_frame": save_ok_frames,
+                 "save_discrete_frame": save_rejected_frames})
 
 
 @multiple_ips
@@ -1554,9 +1561,7 @@ def set_sequence_setting(name):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "set_sequence_setting",
-              "params": [{"group_name": name}]}
-    return send_command(params)
+    return _rpc("set_sequence_setting", [{"group_name": name}])
 
 
 @multiple_ips
@@ -1580,17 +1585,12 @@ def set_sensor_calibration(x, y, z, x11, x12, y11, y12):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "set_sensor_calibration",
-              "params": {"compassSensor": {"x": x,
-                                           "y": y,
-                                           "z": z,
-                                           "x11": x11,
-                                           "x12": x12,
-                                           "y11": y11,
-                                           "y12": y12,}
-                         }
-              }
-    return send_command(params)
+    reply = _rpc("set_sensor_calibration",
+                 {"compassSensor": {"x": x, "y": y, "z": z,
+                                    "x11": x11, "x12": x12,
+                                    "y11": y11, "y12": y12}})
+    get_sensor_calibration.cache_clear()  # after, so no poll re-caches
+    return reply
 
 
 @multiple_ips
@@ -1618,11 +1618,11 @@ def set_user_location(lat, lon):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'set_user_location',
-              'params': {'lat': lat,
-                         'lon': lon,
-                         'force': True}}
-    return send_command(params)
+    reply = _rpc("set_user_location", {'lat': lat,
+                                       'lon': lon,
+                                       'force': True})
+    get_user_location.cache_clear()  # after, so no poll re-caches
+    return reply
 
 
 @multiple_ips
@@ -1645,8 +1645,7 @@ def set_wheel_position(pos):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "set_wheel_position", "params": [pos]}
-    return send_command(params)
+    return _rpc("set_wheel_position", [pos])
 
 
 @multiple_ips
@@ -1662,8 +1661,7 @@ def scope_get_equ_coord():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_get_equ_coord'}
-    return send_command(params)
+    return _rpc("scope_get_equ_coord")
 
 
 @multiple_ips
@@ -1679,8 +1677,7 @@ def scope_get_horiz_coord():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_get_horiz_coord'}
-    return send_command(params)
+    return _rpc("scope_get_horiz_coord")
 
 
 @multiple_ips
@@ -1698,8 +1695,7 @@ def scope_get_ra_dec():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_get_ra_dec'}
-    return send_command(params)
+    return _rpc("scope_get_ra_dec")
 
 
 @multiple_ips
@@ -1717,8 +1713,7 @@ def scope_get_track_state():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_get_track_state'}
-    return send_command(params)
+    return _rpc("scope_get_track_state")
 
 
 @multiple_ips
@@ -1749,8 +1744,9 @@ def scope_goto(ra, dec):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_goto', 'params': [ra, dec]}
-    return send_command(params)
+    reply = _rpc("scope_goto", [ra, dec])
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1776,8 +1772,9 @@ def scope_move_to_horizon():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_move_to_horizon'}
-    return send_command(params)
+    reply = _rpc("scope_move_to_horizon")
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1810,9 +1807,9 @@ def scope_park(set_eq_mode=False):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_park',
-              "params": {"equ_mode": set_eq_mode}}
-    return send_command(params)
+    reply = _rpc("scope_park", {"equ_mode": set_eq_mode})
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1839,8 +1836,9 @@ def scope_set_track_state(flag):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_set_track_state', "params": flag}
-    return send_command(params)
+    reply = _rpc("scope_set_track_state", flag)
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1867,8 +1865,7 @@ def scope_sync(in_ra, in_dec):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'scope_sync', "params": [in_ra, in_dec]}
-    return send_command(params)
+    return _rpc("scope_sync", [in_ra, in_dec])
 
 
 @multiple_ips
@@ -1930,9 +1927,10 @@ def scope_speed_move(angle, speed, dur_sec):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "scope_speed_move",
-              "params": {"speed": speed, "angle": angle, "dur_sec": dur_sec}}
-    return send_command(params)
+    reply = _rpc("scope_speed_move",
+                 {"speed": speed, "angle": angle, "dur_sec": dur_sec})
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -1948,8 +1946,7 @@ def start_auto_focuse():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "start_auto_focuse"}
-    return send_command(params)
+    return _rpc("start_auto_focuse")
 
 
 @multiple_ips
@@ -1965,8 +1962,7 @@ def start_create_dark():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "start_create_dark"}
-    return send_command(params)
+    return _rpc("start_create_dark")
 
 
 @multiple_ips
@@ -1990,11 +1986,8 @@ def start_polar_align(restart=True, dec_pos_index=3):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "start_polar_align",
-              "params": {"restart": restart,
-                         "dec_pos_index": dec_pos_index}
-              }
-    return send_command(params)
+    return _rpc("start_polar_align", {"restart": restart,
+                                      "dec_pos_index": dec_pos_index})
 
 
 @multiple_ips
@@ -2010,8 +2003,7 @@ def start_scan_planet():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "start_scan_planet"}
-    return send_command(params)
+    return _rpc("start_scan_planet")
 
 
 @multiple_ips
@@ -2027,8 +2019,7 @@ def start_solve():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "start_solve"}
-    return send_command(params)
+    return _rpc("start_solve")
 
 
 @multiple_ips
@@ -2044,8 +2035,7 @@ def stop_auto_focuse():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "stop_auto_focuse"}
-    return send_command(params)
+    return _rpc("stop_auto_focuse")
 
 
 @multiple_ips
@@ -2061,8 +2051,7 @@ def stop_create_dark():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "stop_create_dark"}
-    return send_command(params)
+    return _rpc("stop_create_dark")
 
 
 @multiple_ips
@@ -2078,8 +2067,9 @@ def stop_goto_target():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "stop_goto_target"}
-    return send_command(params)
+    reply = _rpc("stop_goto_target")
+    _mount_state_changed()
+    return reply
 
 
 @multiple_ips
@@ -2095,8 +2085,7 @@ def stop_polar_align():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "stop_polar_align"}
-    return send_command(params)
+    return _rpc("stop_polar_align")
 
 
 @multiple_ips
@@ -2112,8 +2101,7 @@ def stop_solve():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "stop_solve"}
-    return send_command(params)
+    return _rpc("stop_solve")
 
 
 @multiple_ips
@@ -2129,8 +2117,7 @@ def stop_scheduler():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {"method": "stop_scheduler"}
-    return send_command(params)
+    return _rpc("stop_scheduler")
 
 
 @multiple_ips
@@ -2146,8 +2133,7 @@ def test_connection():
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    params = {'method': 'test_connection'}
-    return send_command(params)
+    return _rpc("test_connection")
 
 
 @multiple_ips
@@ -2170,4 +2156,65 @@ def random_command(method, params=None):
     -----
     Accepts the ``ips`` keyword for multi-Seestar operation.
     """
-    return send_command({"method": method, "params": params})
\ No newline at end of file
+    return send_command({"method": method, "params": params})
+
+
+@multiple_ips
+def batch(*commands):
+    """
+    Send several independent commands in a single round-trip.
+
+    All commands are written to the Seestar before any reply is read (see
+    :func:`~seestarpy.connection.send_commands`), so a status poll of N
+    getters costs about one network round-trip instead of N.
+
+    Parameters
+    ----------
+    *commands : str or dict
+        Either a bare method name (for commands without parameters) or a
+        full ``{"method": ..., "params": ...}`` dict.
+
+    Returns
+    -------
+    list of dict
+        One response per command, in the order given.
+
+    Examples
+    --------
+
+        >>> from seestarpy import raw
+        >>> state, equ = raw.batch(
+        ...     {"method": "get_device_state", "params": {"keys": ["mount"]}},
+        ...     "scope_get_equ_coord",
+        ... )
+
+    Notes
+    -----
+    Commands are executed in order but independently; only batch commands
+    that don't depend on each other's results.
+
+    Accepts the ``ips`` keyword for multi-Seestar operation.
+    """
+    params_list = [{"method": c} if isinstance(c, str) else c
+                   for c in commands]
+    return send_commands(params_list)
+
+
+def invalidate_all_caches():
+    """
+    Forget every cached getter reply so the next call queries the Seestar.
+
+    Read-only getters such as :func:`get_albums` and
+    :func:`get_user_location` keep their replies for a short while (see
+    :func:`~seestarpy.connection.ttl_cache`).  The matching setters clear
+    their own getter's cache; call this after changing device state any
+    other way, e.g. with :func:`random_command` or from the Seestar app.
+
+    Examples
+    --------
+
+        >>> from seestarpy import raw
+        >>> raw.invalidate_all_caches()
+
+    """
+    clear_ttl_caches()
@@ -1,7 +1,58 @@
+import math
 from datetime import datetime as dt
+from numbers import Real
+from types import MappingProxyType
 
 from . import raw
-from .connection import send_command, multiple_ips
+from .connection import send_command, send_commands, multiple_ips, ttl_cache
+
+_COMPASS_POINTS = (
+    "N", "NNE", "NE", "ENE",
+    "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW",
+    "W", "WNW", "NW", "NNW",
+)
+
+# Read-only default for status_bar's nested .get() chains, so a missing
+# key doesn't allocate a fresh {} at every level.
+_EMPTY = MappingProxyType({})
+
+# Placeholder pair for coordinates the device hasn't reported yet.
+_DASH2 = ("---", "---")
+
+# Queries behind status_bar(); send_commands never mutates them.
+_STATUS_COMMANDS = [
+    {"method": "get_device_state",
+     "params": {"keys": ["balance_sensor", "mount", "pi_status", "storage"]}},
+    {"method": "iscope_get_app_state"},
+    {"method": "scope_get_horiz_coord"},
+    {"method": "scope_get_ra_dec"},
+]
+
+# Layout for status_bar(); cell widths live in the format specs so each
+# call is a single format_map() over the queried values.
+_STATUS_TEMPLATE = """
+|================|================|================|================|==========|
+| View           | Coordinates    | Observation    | Initialisation | Seestar  |
+|================|================|================|================|==========|
+|      MODE      | TARGET RA/DEC  |   LP FILTER    |   DARK FRAME   | BATTERY  |
+| {t11:^14} | {t21a:<7} {t21b:<6} | {t31:^14} | {t41:^14} | {t51:^7} |
+|----------------|----------------|----------------|----------------|----------|
+|     STATE      | CURRENT RA/DEC | EXPOSURE TIME  | FOCUS POSITION | FREE MB  |
+| {t12:^14} | {t22a:<7} {t22b:<6} | {t32:^14} | {t42:^14} | {t52:^8} |
+|----------------|----------------|----------------|----------------|----------|
+|     ERROR      | ALT   AZ  COMP | STACK    DROP  |   PLATE SOLVE  | EQ_MODE  |
+| {t13:^14} | {al:<4} {az:<4} {co:<4} | {t33a:<6}   {t33b:<6}| {t43:^14} | {t53:^8} |
+|----------------|----------------|----------------|----------------|----------|
+|  TARGET NAME   | BALANCE ANGLE  |    TRACKING    |  SOLVE ERROR   |   TIME   |
+| {t14:^14} | {t24:^14} | {t34:^14} | {t44:^14} | {t54:^8} |
+|================|================|================|================|==========|
+"""
+
+
+def _safe_round(value, ndigits=None):
+    """Round numbers; pass placeholders like ``"---"`` through untouched."""
+    return round(value, ndigits) if isinstance(value, Real) else value
 
 
 @multiple_ips
@@ -10,8 +61,9 @@ def status_bar(return_type="str"):
     Query the Seestar and return a formatted ASCII status dashboard.
 
     Pulls data from multiple device endpoints (device state, app state,
-    coordinates) and combines them into a single table.  Useful for
-    quick at-a-glance monitoring in a terminal or Jupyter notebook.
+    coordinates), sent together in a single round-trip, and combines them
+    into a single table.  Useful for quick at-a-glance monitoring in a
+    terminal or Jupyter notebook.
 
     Parameters
     ----------
@@ -46,60 +98,51 @@ def status_bar(return_type="str"):
 
     """
 
-    dev = raw.get_device_state(["balance_sensor", "mount", "pi_status",
-                            "storage"]).get("result", {})
-    app = raw.iscope_get_app_state().get("result", {})
-    view = app.get("View", {})
-    azalt = raw.scope_get_horiz_coord().get("result", ["---", "---"])
-    radec = raw.scope_get_ra_dec().get("result", ["---", "---"])
-
-    t11 = f'{view.get("mode", "---"):^14}'
-    t12 = f'{view.get("state", "---"):^14}'
-    t13 = f'{view.get("error", "---"):^14}'
-    t14 = f'{view.get("target_name", "---"):^14}'
-
-    t21a = f'{round(view.get("target_ra_dec", ["---", "---"])[0], 3):<7}'
-    t21b = f'{round(view.get("target_ra_dec", ["---", "---"])[1], 2):<6}'
-    t22a = f'{round(radec[0], 3):<7}'
-    t22b = f'{round(radec[1], 2):<6}'
-    al = f'{round(azalt[0]):<4}'
-    az = f'{round(azalt[1]):<4}'
-    co = f'{azimuth_to_compass(azalt[1]):<4}'
-    t24 = f'{round(dev.get("balance_sensor", {}).get("data", {}).get("angle", "---"), 3):^14}'
-
-    t31 = f'{str(view.get("lp_filter")):^14}'
-    t32 = f'{view.get("Stack", {}).get("Exposure", {}).get("exp_ms", 0)/1000:^14}'
-    t33a = f'{view.get("Stack", {}).get("stacked_frame", "---"):<6}'
-    t33b = f'{view.get("Stack", {}).get("dropped_frame", "---"):<6}'
-    t34 = f'{str(dev.get("mount", {}).get("tracking")):^14}'
-
-    t41 = f'{app.get("DarkLibrary", {}).get("percent", "---"):^14}'
-    t42 = f'{app.get("FocuserMove", {}).get("position", "---"):^14}'
-    t43 = f'{app.get("PlateSolve", view.get("PlateSolve", {}).get("PlateSolve",{})).get("state", "---"):^14}'
-    t44 = f'{app.get("PlateSolve", view.get("PlateSolve", {}).get("PlateSolve",{})).get("error", "---"):^14}'
-
-    t51 = f'{str(dev.get("pi_status", {}).get("battery_capacity"))+"%":^7}'
-    t52 = f'{dev.get("storage", {}).get("storage_volume", [{}])[0].get("free_mb", "---"):^8}'
-    t53 = f'{str(dev.get("mount", {}).get("equ_mode")):^8}'
-    t54 = f'{dt.now().strftime("%H:%M:%S"):^8}'
-
-    return f"""
-|================|================|================|================|==========|
-| View           | Coordinates    | Observation    | Initialisation | Seestar  |
-|================|================|================|================|==========|
-|      MODE      | TARGET RA/DEC  |   LP FILTER    |   DARK FRAME   | BATTERY  |
-| {t11         } | {t21a } {t21b} | {t31         } | {t41         } | {t51   } |
-|----------------|----------------|----------------|----------------|----------|
-|     STATE      | CURRENT RA/DEC | EXPOSURE TIME  | FOCUS POSITION | FREE MB  |
-| {t12         } | {t22a } {t22b} | {t32         } | {t42         } | {t52   } |
-|----------------|----------------|----------------|----------------|----------|
-|     ERROR      | ALT   AZ  COMP | STACK    DROP  |   PLATE SOLVE  | EQ_MODE  |
-| {t13         } | {al} {az} {co} | {t33a}   {t33b}| {t43         } | {t53   } |
-|----------------|----------------|----------------|----------------|----------|
-|  TARGET NAME   | BALANCE ANGLE  |    TRACKING    |  SOLVE ERROR   |   TIME   |
-| {t14         } | {t24         } | {t34         } | {t44         } | {t54   } |
-|================|================|================|================|==========|
-"""
+    # The four queries are independent, so pipeline them in one round-trip.
+    dev, app, azalt, radec = send_commands(_STATUS_COMMANDS)
+    dev = dev.get("result", _EMPTY)
+    app = app.get("result", _EMPTY)
+    view = app.get("View", _EMPTY)
+    azalt = azalt.get("result", _DASH2)
+    radec = radec.get("result", _DASH2)
+    target_ra_dec = view.get("target_ra_dec", _DASH2)
+
+    stack = view.get("Stack", _EMPTY)
+    balance = dev.get("balance_sensor", _EMPTY).get("data", _EMPTY)
+    plate_solve = app.get("PlateSolve")
+    if plate_solve is None:     # only dig into View when it's needed
+        plate_solve = view.get("PlateSolve", _EMPTY).get("PlateSolve", _EMPTY)
+    return _STATUS_TEMPLATE.format_map({
+        "t11": view.get("mode", "---"),
+        "t12": view.get("state", "---"),
+        "t13": view.get("error", "---"),
+        "t14": view.get("target_name", "---"),
+
+        "t21a": _safe_round(target_ra_dec[0], 3),
+        "t21b": _safe_round(target_ra_dec[1], 2),
+        "t22a": _safe_round(radec[0], 3),
+        "t22b": _safe_round(radec[1], 2),
+        "al": _safe_round(azalt[0]),
+        "az": _safe_round(azalt[1]),
+        "co": azimuth_to_compass(azalt[1]) if isinstance(azalt[1], Real) else "---",
+        "t24": _safe_round(balance.get("angle", "---"), 3),
+
+        "t31": str(view.get("lp_filter")),
+        "t32": stack.get("Exposure", _EMPTY).get("exp_ms", 0)/1000,
+        "t33a": stack.get("stacked_frame", "---"),
+        "t33b": stack.get("dropped_frame", "---"),
+        "t34": str(dev.get("mount", _EMPTY).get("tracking")),
+
+        "t41": app.get("DarkLibrary", _EMPTY).get("percent", "---"),
+        "t42": app.get("FocuserMove", _EMPTY).get("position", "---"),
+        "t43": plate_solve.get("state", "---"),
+        "t44": plate_solve.get("error", "---"),
+
+        "t51": str(dev.get("pi_status", _EMPTY).get("battery_capacity"))+"%",
+        "t52": dev.get("storage", _EMPTY).get("storage_volume", (_EMPTY,))[0].get("free_mb", "---"),
+        "t53": str(dev.get("mount", _EMPTY).get("equ_mode")),
+        "t54": dt.now().strftime("%H:%M:%S"),
+    })
 
 
 @multiple_ips
@@ -130,6 +173,16 @@ def get_firmware_version():
             .get("firmware_ver_string"))
 
 
+def _is_mount_state(state):
+    """True for a non-empty mount dict, or an IP-keyed dict of them."""
+    if not isinstance(state, dict) or not state:
+        return False
+    if all(isinstance(v, dict) for v in state.values()):   # multiple_ips
+        return all(_is_mount_state(v) for v in state.values())
+    return True
+
+
+@ttl_cache(1.0, should_cache=_is_mount_state)
 @multiple_ips
 def get_mount_state():
     """
@@ -153,6 +206,14 @@ def get_mount_state():
     -----
     Accepts the ``ips`` keyword for querying multiple Seestars simultaneously.
 
+    The reply is cached per Seestar for 1 s (see
+    :func:`~seestarpy.connection.ttl_cache`), so :func:`is_eq_mode`,
+    :func:`is_tracking` and :func:`is_parked` called back-to-back share one
+    query.  An error or empty reply is not cached.  The raw commands that
+    move or park the mount, and :func:`~seestarpy.plan.set_view_plan` /
+    :func:`~seestarpy.plan.stop_view_plan`, clear the cache; call
+    :func:`invalidate_mount_state` after changing it any other way.
+
     Examples
     --------
 
@@ -164,6 +225,11 @@ def get_mount_state():
     return raw.get_device_state(keys=["mount"]).get("result", {}).get("mount", {})
 
 
+def invalidate_mount_state():
+    """Drop the cached :func:`get_mount_state` reply for every Seestar."""
+    get_mount_state.cache_clear()
+
+
 @multiple_ips
 def is_eq_mode():
     """
@@ -427,16 +493,17 @@ def azimuth_to_compass(degrees):
 
     Parameters
     ----------
-    degrees : float
-        Azimuth in decimal degrees [0, 360).
+    degrees : float or array_like
+        Azimuth in decimal degrees [0, 360).  Arrays (e.g. a logged
+        azimuth history) are converted in one vectorised numpy pass.
 
     Returns
     -------
-    str
+    str or numpy.ndarray
         One of the 16 compass points: ``'N'``, ``'NNE'``, ``'NE'``,
         ``'ENE'``, ``'E'``, ``'ESE'``, ``'SE'``, ``'SSE'``, ``'S'``,
         ``'SSW'``, ``'SW'``, ``'WSW'``, ``'W'``, ``'WNW'``, ``'NW'``,
-        ``'NNW'``.
+        ``'NNW'``; an array of them for array input.
 
     Examples
     --------
@@ -448,13 +515,16 @@ def azimuth_to_compass(degrees):
         'SE'
         >>> azimuth_to_compass(312.7)
         'NW'
+        >>> azimuth_to_compass([0, 90, 181])
+        array(['N', 'E', 'S'], dtype='<U3')
 
     """
-    directions = [
-        "N", "NNE", "NE", "ENE",
-        "E", "ESE", "SE", "SSE",
-        "S", "SSW", "SW", "WSW",
-        "W", "WNW", "NW", "NNW"
-    ]
-    idx = int((degrees % 360) / 22.5 + 0.5) % 16
-    return directions[idx]
\ No newline at end of file
+    # Nearest 22.5° sector; flooring (not truncating) keeps negative angles
+    # right, and "& 15" wraps any whole number of turns without a modulo.
+    if isinstance(degrees, Real):
+        return _COMPASS_POINTS[math.floor(degrees / 22.5 + 0.5) & 15]
+
+    import numpy as np
+
+    idx = np.floor(np.asarray(degrees, dtype=float) / 22.5 + 0.5).astype(int) & 15
+    return np.array(_COMPASS_POINTS)[idx]
\ No newline at end of file
@@ -87,12 +87,24 @@ HEADER_SIZE = 34
 MAGIC_NUMBER = 0x03C3
 """Magic number (963) that marks the start of every image frame."""
 
+# Big-endian header layout: magic, version, 2 pad, uint32 length, 2 pad,
+# four uint8 flags (bytes 12-15), seven uint16 fields (16-29), 4 pad.
+_HEADER = struct.Struct('>HH2xI2xBBBB7H4x')
+_HEADER_FIELDS = (
+    'magic', 'version', 'length',
+    'is_big_endian', 'img_type', 'data_type', 'frame_id',
+    'width', 'height', 'hfd_x', 'hfd_y', 'hfd', 'can_debayer', 'image_id',
+)
+
 HEARTBEAT_INTERVAL = 4
 """Seconds between ``test_connection`` heartbeats (matches the app)."""
 
 _RECV_BUF = 65536
 """Socket receive buffer size (64 KB, matches the app's setting)."""
 
+_MAX_PAYLOAD = 256 * 1024 * 1024
+"""Largest payload length accepted from a header (a 48 bpp 4K frame is ~50 MB)."""
+
 # Image-type constants from the header's ``img_type`` field.
 IMG_TYPE_PREVIEW = 1
 """Single unstacked preview frame."""
@@ -120,7 +132,7 @@ def decode_payload(payload, header):
 
     Parameters
     ----------
-    payload : bytes
+    payload : bytes or bytearray
         Raw payload bytes from :func:`get_live_image` or the streaming
         callback.
     header : dict
@@ -180,7 +192,7 @@ def save_image(payload, header, path, stretch=True):
 
     Parameters
     ----------
-    payload : bytes
+    payload : bytes or bytearray
         Raw payload bytes.
     header : dict
         Parsed frame header.
@@ -224,24 +236,43 @@ def _save_fits(payload, header, path):
 
 def _save_image_pil(payload, header, path, stretch):
     """Save as a Pillow-supported format (PNG, JPEG, TIFF, ...)."""
-    import numpy as np
     from PIL import Image
 
-    arr = decode_payload(payload, header)
-
-    if arr.ndim == 2:
-        # Single-channel Bayer → stack to RGB for consistent processing
-        arr = np.stack([arr, arr, arr], axis=2)
-
-    if stretch:
-        arr8 = _auto_stretch(arr)
-    else:
-        arr8 = (arr >> 8).astype(np.uint8)
+    arr8 = _to_rgb8(decode_payload(payload, header), stretch)
 
     img = Image.fromarray(arr8, 'RGB')
     img.save(path)
 
 
+def _uint16_percentiles(arr, qs):
+    """Per-channel percentiles of a ``(H, W, C)`` uint16 array.
+
+    Counts each channel into a 65536-bin histogram and reads the ranks off
+    its cumulative sum, interpolating like ``np.percentile``'s default
+    ``"linear"`` method.  This is O(N) rather than the O(N log N)-ish
+    partition ``np.percentile`` does on a float copy of the frame.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        One ``(1, 1, C)`` float32 array per entry of *qs*.
+    """
+    import numpy as np
+
+    h, w, c = arr.shape
+    n = h * w
+    out = np.empty((len(qs), 1, 1, c), dtype=np.float32)
+    for ch in range(c):
+        cdf = np.bincount(arr[:, :, ch].ravel(), minlength=65536).cumsum()
+        for i, q in enumerate(qs):
+            pos = q / 100 * (n - 1)
+            lo = int(pos)
+            # Value at sorted index k is the first bin whose count exceeds k.
+            v0, v1 = np.searchsorted(cdf, (lo + 1, min(lo + 2, n)))
+            out[i, 0, 0, ch] = v0 + (pos - lo) * (v1 - v0)
+    return list(out)
+
+
 def _auto_stretch(arr):
     """Apply an aggressive midtone stretch to reveal faint nebulosity.
 
@@ -258,32 +289,74 @@ def _auto_stretch(arr):
     Parameters
     ----------
     arr : numpy.ndarray
-        ``(H, W, 3)`` uint16 array.
+        ``(H, W, C)`` uint16 array.
 
     Returns
     -------
     numpy.ndarray
-        ``(H, W, 3)`` uint8 array, stretched.
+        ``(H, W, C)`` uint8 array, stretched.
     """
     import numpy as np
 
     # Work in float32 for the nonlinear curve
     img = arr.astype(np.float32)
 
-    # Per-channel percentile clipping
-    black = np.percentile(img, 0.5, axis=(0, 1), keepdims=True)
-    white = np.percentile(img, 99.95, axis=(0, 1), keepdims=True)
-
-    # Normalise to 0-1
-    img = (img - black) / (white - black + 1e-6)
+    # Per-channel percentile clipping.  Seestar frames are uint16, where a
+    # histogram gives the same percentiles far faster than partitioning.
+    if arr.dtype == np.uint16:
+        black, white = _uint16_percentiles(arr, (0.5, 99.95))
+    else:
+        black, white = np.percentile(img, (0.5, 99.95), axis=(0, 1),
+                                     keepdims=True)
+
+    # Normalise to 0-1.  Everything below works in place on img (plus one
+    # buffer for the MTF denominator) so a full-resolution frame doesn't
+    # allocate a fresh float32 copy at every step.
+    img -= black
+    img /= white - black + 1e-6
     np.clip(img, 0.0, 1.0, out=img)
 
     # Midtone Transfer Function — m=0.15 is aggressive but keeps
     # star colours intact.  MTF(x,m) = (m-1)*x / ((2m-1)*x - m)
     m = 0.15
-    img = (m - 1.0) * img / ((2.0 * m - 1.0) * img - m)
+    denom = img * (2.0 * m - 1.0)
+    denom -= m
+    img *= m - 1.0
+    img /= denom
+
+    img *= 255.0
+    img += 0.5
+    return img.astype(np.uint8)
+
+
+def _to_rgb8(arr, stretch=True):
+    """Convert a decoded frame to an ``(H, W, 3)`` uint8 display image.
+
+    Single-channel (Bayer) frames are stretched as one channel and only
+    the 8-bit result is replicated to pseudo-RGB, rather than stacking
+    three identical uint16 channels and stretching each of them.
 
-    return (img * 255.0 + 0.5).astype(np.uint8)
+    Parameters
+    ----------
+    arr : numpy.ndarray
+        ``(H, W, 3)`` or ``(H, W)`` uint16 array from
+        :func:`decode_payload`.
+    stretch : bool, optional
+        Apply :func:`_auto_stretch`; otherwise keep the top 8 bits.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(H, W, 3)`` uint8 array.
+    """
+    import numpy as np
+
+    if arr.ndim == 2:
+        arr = arr[:, :, None]
+    arr8 = _auto_stretch(arr) if stretch else (arr >> 8).astype(np.uint8)
+    if arr8.shape[2] == 1:
+        arr8 = np.repeat(arr8, 3, axis=2)
+    return arr8
 
 
 def _decompress_payload(payload):
@@ -353,34 +426,7 @@ def parse_header(buf):
             f"Header must be {HEADER_SIZE} bytes, got {len(buf)}"
         )
 
-    # Unpack all uint16 fields in one go, plus the uint32 length.
-    magic = struct.unpack_from('>H', buf, 0)[0]
-    version = struct.unpack_from('>H', buf, 2)[0]
-    length = struct.unpack_from('>I', buf, 6)[0]
-    width = struct.unpack_from('>H', buf, 16)[0]
-    height = struct.unpack_from('>H', buf, 18)[0]
-    hfd_x = struct.unpack_from('>H', buf, 20)[0]
-    hfd_y = struct.unpack_from('>H', buf, 22)[0]
-    hfd = struct.unpack_from('>H', buf, 24)[0]
-    can_debayer = struct.unpack_from('>H', buf, 26)[0]
-    image_id = struct.unpack_from('>H', buf, 28)[0]
-
-    return {
-        'magic': magic,
-        'version': version,
-        'length': length,
-        'is_big_endian': buf[12],
-        'img_type': buf[13],
-        'data_type': buf[14],
-        'frame_id': buf[15],
-        'width': width,
-        'height': height,
-        'hfd_x': hfd_x,
-        'hfd_y': hfd_y,
-        'hfd': hfd,
-        'can_debayer': can_debayer,
-        'image_id': image_id,
-    }
+    return dict(zip(_HEADER_FIELDS, _HEADER.unpack(buf)))
 
 
 # ---------------------------------------------------------------------------
@@ -388,16 +434,22 @@ def parse_header(buf):
 # ---------------------------------------------------------------------------
 
 def _recv_exact(sock, n):
-    """Read exactly *n* bytes from *sock*, raising on premature close."""
-    buf = bytearray()
-    while len(buf) < n:
-        chunk = sock.recv(min(n - len(buf), _RECV_BUF))
-        if not chunk:
+    """Read exactly *n* bytes from *sock*, raising on premature close.
+
+    Receives straight into one preallocated buffer, so a multi-MB payload
+    is neither regrown chunk by chunk nor copied again at the end.
+    """
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:got + _RECV_BUF])
+        if not k:
             raise ConnectionError(
-                f"Connection closed after {len(buf)}/{n} bytes"
+                f"Connection closed after {got}/{n} bytes"
             )
-        buf.extend(chunk)
-    return bytes(buf)
+        got += k
+    return buf
 
 
 def _send_json(sock, method):
@@ -429,14 +481,49 @@ def _read_frame(sock):
 
     Returns
     -------
-    tuple[dict, bytes]
+    tuple[dict, bytearray]
         ``(header_dict, image_payload)``
 
+    Frames whose header states an implausible payload length are
+    skipped (or, for nonsense lengths, the scan resynchronises on the
+    next magic number) instead of being read into memory.
+
     Raises
     ------
     ConnectionError
         If the socket closes mid-read.
     """
+    while True:
+        header = _read_header(sock)
+
+        # The payload buffer is allocated up front, so don't trust a corrupt
+        # header (or a false magic match) to size it: at most 48 bpp of the
+        # stated dimensions plus slack for ZIP framing or a short ack body.
+        length = header['length']
+        limit = min(header['width'] * header['height'] * 6 + _RECV_BUF,
+                    _MAX_PAYLOAD)
+        if length <= limit:
+            return header, _recv_exact(sock, length)
+
+        if length <= _MAX_PAYLOAD:
+            # Plausible frame, unexpected size (e.g. a long ack body):
+            # drop its payload without buffering it and read the next one.
+            print(f"Skipping frame {header['image_id']}: payload of "
+                  f"{length} bytes is too large for "
+                  f"{header['width']}x{header['height']}")
+            _skip_exact(sock, length)
+        else:
+            # Nonsense length, most likely a false magic match: rescan
+            # from here for the next real header.
+            print(f"Ignoring corrupt frame header (length {length}); "
+                  f"resynchronising")
+
+
+def _read_header(sock):
+    """Scan *sock* for the next frame magic and parse the header after it.
+
+    JSON-RPC lines and stray bytes before the magic number are skipped.
+    """
     # Synchronise: find the 2-byte magic, skipping JSON responses
     while True:
         first = _recv_exact(sock, 1)
@@ -456,11 +543,17 @@ def _read_frame(sock):
 
     # Read remaining 32 bytes of header (we already consumed bytes 0-1)
     rest = _recv_exact(sock, HEADER_SIZE - 2)
-    raw_header = b'\x03\xC3' + rest
-    header = parse_header(raw_header)
+    return parse_header(b'\x03\xC3' + rest)
 
-    payload = _recv_exact(sock, header['length'])
-    return header, payload
+
+def _skip_exact(sock, n):
+    """Read and discard exactly *n* bytes from *sock*, one chunk at a time."""
+    view = memoryview(bytearray(min(n, _RECV_BUF)))
+    while n > 0:
+        k = sock.recv_into(view[:min(n, len(view))])
+        if not k:
+            raise ConnectionError(f"Connection closed with {n} bytes unread")
+        n -= k
 
 
 def _consume_json_line(sock, first_byte):
@@ -526,7 +619,7 @@ def get_live_image(ip=None, port=IMAGE_PORT, method="get_stacked_img",
 
     Returns
     -------
-    tuple[dict, bytes]
+    tuple[dict, bytearray]
         ``(header, payload)`` where *header* is the parsed 34-byte
         header dict (with non-zero ``width`` and ``height``) and
         *payload* is the raw (compressed) image payload.  Pass both to
@@ -593,14 +686,8 @@ def get_live_image(ip=None, port=IMAGE_PORT, method="get_stacked_img",
 
 def _grab_one(ip, port, stretch):
     """Fetch a frame from one Seestar and return ``(header, arr8)``."""
-    import numpy as np
-
     header, payload = get_live_image(ip=ip, port=port)
-    arr = decode_payload(payload, header)
-    if arr.ndim == 2:
-        arr = np.stack([arr, arr, arr], axis=2)
-    arr8 = _auto_stretch(arr) if stretch else (arr >> 8).astype(np.uint8)
-    return header, arr8
+    return header, _to_rgb8(decode_payload(payload, header), stretch)
 
 
 def _frame_label(ip, header):
@@ -743,8 +830,12 @@ class StreamSession:
         self._stop_event = threading.Event()
         self._reader_thread = None
         self._heartbeat_thread = None
-        self._latest_frame = None  # (header, stretched_uint8) for show()
-        self._has_stacked = False  # True once we've received a stacked frame
+        self._last_frame = None  # (header, payload) from the reader
+        self._frame_seq = 0  # bumped for every image frame published
+        self._frame_cond = threading.Condition()
+        self._latest_frame = None  # (header, payload) for show()
+        self._rendered_frame = None  # last _latest_frame drawn by show()
+        self._has_stacked = False  # True once a stacked frame has decoded
         self._poll_stacked = False  # request stacked images in heartbeat
 
     # -- background threads ------------------------------------------------
@@ -775,39 +866,111 @@ class StreamSession:
                 if not self._stop_event.is_set():
                     print(f"Stream read error: {exc}")
                 break
+            if header['width'] and header['height']:
+                # Acks/keepalives carry no image; don't hand them to
+                # wait_for_frame() callers.
+                self._publish_frame(header, payload)
             if self._on_image is not None:
                 try:
                     self._on_image(header, payload)
                 except Exception as exc:
                     print(f"on_image callback error: {exc}")
-        self.is_running = False
+        with self._frame_cond:
+            self.is_running = False
+            self._frame_cond.notify_all()  # wake wait_for_frame() callers
+
+    def _publish_frame(self, header, payload):
+        """Make a frame the latest one and wake :meth:`wait_for_frame`."""
+        with self._frame_cond:
+            self._last_frame = (header, payload)
+            self._frame_seq += 1
+            self._frame_cond.notify_all()
+
+    def wait_for_frame(self, timeout=None):
+        """Block until the next frame arrives and return it.
+
+        An alternative to polling or an *on_image* callback for scripts
+        that just want "the next image".
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait.  ``None`` waits indefinitely.
+
+        Returns
+        -------
+        tuple[dict, bytearray] or None
+            ``(header, payload)`` of the next image-bearing frame (acks
+            and keepalives are skipped), or ``None`` if the timeout
+            expired or the stream stopped first.
+
+        Examples
+        --------
+        ::
+
+            >>> session = stream.start_stream()
+            >>> header, payload = session.wait_for_frame(timeout=10)
+            >>> arr = stream.decode_payload(payload, header)
+        """
+        # Snapshot and wait under one lock: a frame published in between
+        # bumps the counter, so the predicate sees it and returns at once.
+        with self._frame_cond:
+            seq = self._frame_seq
+            self._frame_cond.wait_for(
+                lambda: self._frame_seq != seq or not self.is_running,
+                timeout)
+            return self._last_frame if self._frame_seq != seq else None
 
     # -- matplotlib live display -------------------------------------------
 
     def _display_callback(self, header, payload):
-        """Internal callback that decodes and stretches each frame.
+        """Internal callback that hands each frame to the live display.
+
+        Frames are only stored here; decoding and stretching happen in
+        :meth:`_render_latest` when the display next refreshes, so frames
+        that arrive between refreshes cost nothing.
 
-        Once a stacked frame (img_type=5) has been received, preview
+        Once a stacked frame (img_type=5) has been displayed, preview
         frames are ignored so the display stays on the better image.
         """
-        import numpy as np
+        if header['width'] == 0 or header['height'] == 0:
+            return  # skip ack/keepalive frames
 
-        if self._has_stacked and header['img_type'] != IMG_TYPE_STACKED:
-            return
+        if header['img_type'] != IMG_TYPE_STACKED:
+            if self._has_stacked:
+                return
+            latest = self._latest_frame
+            if (latest is not None and latest is not self._rendered_frame
+                    and latest[0]['img_type'] == IMG_TYPE_STACKED):
+                return  # don't bump a stacked frame that hasn't been drawn
+
+        self._latest_frame = (header, payload)
+
+    def _render_latest(self):
+        """Decode and stretch the most recent frame, once per new frame.
+
+        Returns
+        -------
+        tuple or None
+            ``(header, stretched_uint8)``, or ``None`` if no new frame
+            has arrived since the last call or it could not be decoded.
+        """
+        frame = self._latest_frame
+        if frame is None or frame is self._rendered_frame:
+            return None
+        self._rendered_frame = frame
+        header, payload = frame
 
         try:
             arr = decode_payload(payload, header)
         except ValueError:
-            return  # skip ack/keepalive frames
+            return None
 
+        # Only switch to stacked-only once a stacked frame actually
+        # decodes; a corrupt one mustn't lock out the previews.
         if header['img_type'] == IMG_TYPE_STACKED:
             self._has_stacked = True
-
-        if arr.ndim == 2:
-            # Single-channel Bayer → convert to pseudo-RGB for display
-            arr = np.stack([arr, arr, arr], axis=2)
-
-        self._latest_frame = (header, _auto_stretch(arr))
+        return header, _to_rgb8(arr)
 
     def show(self):
         """Open a live matplotlib window showing streamed frames.
@@ -852,7 +1015,7 @@ class StreamSession:
         im = [None]  # mutable ref for the closure
 
         def _update(_frame_number):
-            frame = self._latest_frame
+            frame = self._render_latest()
             if frame is None:
                 return
             header, arr8 = frame
@@ -907,7 +1070,9 @@ class StreamSession:
             self._reader_thread.join(timeout=5)
         if self._heartbeat_thread is not None:
             self._heartbeat_thread.join(timeout=5)
-        self.is_running = False
+        with self._frame_cond:
+            self.is_running = False
+            self._frame_cond.notify_all()
 
 
 def start_stream(ip=None, port=IMAGE_PORT, on_image=None,
@@ -929,7 +1094,7 @@ def start_stream(ip=None, port=IMAGE_PORT, on_image=None,
     port : int, optional
         Image stream port.  Default is :data:`IMAGE_PORT` (4800).
     on_image : callable, optional
-        ``on_image(header: dict, data: bytes)`` called for each frame.
+        ``on_image(header: dict, data: bytearray)`` called for each frame.
         *header* is the parsed 34-byte header dict; *data* is the raw
         image payload.
     with_matplotlib : bool, optional
@@ -5,7 +5,11 @@ nested @multiple_ips scope inheritance, and the persistent _Connection
 (reuse one authenticated socket; reconnect + retry once on drop).
 """
 
+import asyncio
 import json
+import socket
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -26,6 +30,8 @@ def _isolate_connection_state():
     with patch("seestarpy.auth.KEY_PATH", None):
         yield
     connection.close_connections()
+    if hasattr(connection._active, "ip"):
+        del connection._active.ip
     connection.DEFAULT_IP = orig_ip
     connection.AVAILABLE_IPS = orig_avail
     connection.VERBOSE_LEVEL = orig_verbose
@@ -115,6 +121,10 @@ class _FakeSock:
     def settimeout(self, t):
         pass
 
+    def setsockopt(self, level, option, value):
+        self.options = getattr(self, "options", {})
+        self.options[(level, option)] = value
+
     def connect(self, addr):
         self.connected_to = addr
 
@@ -156,6 +166,7 @@ class TestPersistentConnection:
         assert r1["method"] == "a" and r2["method"] == "b"
         assert len(created) == 1            # only one socket opened
         assert sock.connected_to == ("9.9.9.9", connection.DEFAULT_PORT)
+        assert sock.options[(socket.IPPROTO_TCP, socket.TCP_NODELAY)] == 1
 
     def test_reconnects_after_drop(self):
         connection.DEFAULT_IP = "9.9.9.9"
@@ -205,3 +216,322 @@ class TestPersistentConnection:
 
         assert len(created) == 2            # a fresh socket per call
         assert socks[0].closed is True
+
+
+class _EchoSock(_FakeSock):
+    """Answers every ``\\r\\n`` line of each sendall, in reverse order.
+
+    Replying out of order (with an unsolicited event mixed in) checks that
+    pipelined replies are matched to their commands by id, not position.
+    """
+
+    def sendall(self, data):
+        self._sends += 1
+        cmds = [json.loads(line) for line in data.decode().split("\r\n") if line]
+        self.sent = getattr(self, "sent", []) + cmds
+        frames = [{"Event": "PiStatus", "temp": 40}]
+        frames += [{"id": c["id"], "method": c["method"], "code": 0}
+                   for c in reversed(cmds)]
+        if self._sends in self.drop_on:
+            frames = frames[:2]     # answer one command, then drop
+        self._recv += "".join(json.dumps(f) + "\r\n" for f in frames).encode()
+
+
+class TestSendCommands:
+    def test_one_send_replies_in_request_order(self):
+        connection.DEFAULT_IP = "9.9.9.9"
+        sock = _EchoSock([])
+
+        with patch("seestarpy.connection.socket.socket", return_value=sock):
+            replies = connection.send_commands(
+                [{"method": "a"}, {"method": "b"}, {"method": "c"}])
+
+        assert [r["method"] for r in replies] == ["a", "b", "c"]
+        assert sock._sends == 1
+        assert len({c["id"] for c in sock.sent}) == 3
+
+    def test_retry_resends_only_unanswered(self):
+        connection.DEFAULT_IP = "9.9.9.9"
+        dropped = _EchoSock([], drop_on=(1,))
+        fresh = _EchoSock([])
+        created = []
+
+        def factory(*a, **k):
+            sock = dropped if not created else fresh
+            created.append(sock)
+            return sock
+
+        with patch("seestarpy.connection.socket.socket", side_effect=factory):
+            replies = connection.send_commands(
+                [{"method": "a"}, {"method": "b"}])
+
+        assert [r["method"] for r in replies] == ["a", "b"]
+        assert [c["method"] for c in fresh.sent] == ["a"]
+
+    def test_empty_list_sends_nothing(self):
+        with patch("seestarpy.connection.socket.socket") as factory:
+            assert connection.send_commands([]) == []
+        factory.assert_not_called()
+
+
+class TestEncodeCommand:
+    def test_method_only_line_is_cached(self):
+        a = connection._encode_command({"method": "get_device_state"}, 1)
+        b = connection._encode_command({"method": "get_device_state"}, 1)
+        assert a is b
+        assert json.loads(a) == {"id": 1, "verify": True,
+                                 "method": "get_device_state"}
+        assert a.endswith(b"\r\n")
+
+    def test_params_are_encoded_fresh(self):
+        params = {"method": "scope_park", "params": {"equ_mode": True}}
+        line = connection._encode_command(params, 2)
+        assert json.loads(line) == {"id": 2, "verify": True, **params}
+        assert params == {"method": "scope_park",
+                          "params": {"equ_mode": True}}   # not mutated
+
+    def test_stdlib_fallback_without_orjson(self):
+        cmd = {"id": 3, "method": "set_setting", "params": {"exp_ms": 10.5}}
+        with patch.object(connection, "_orjson", None):
+            assert json.loads(connection._dumps(cmd)) == cmd
+
+    def test_loads_without_orjson(self):
+        with patch.object(connection, "_orjson", None):
+            assert connection._loads('{"id": 1, "result": [1.5]}') == \
+                {"id": 1, "result": [1.5]}
+            with pytest.raises(json.JSONDecodeError):
+                connection._loads("not json")
+
+
+class _ChunkSock:
+    """Hands out pre-split byte chunks from recv, then EOF."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def recv(self, n):
+        return self._chunks.pop(0) if self._chunks else b""
+
+
+class TestNextFrame:
+    def _conn(self, chunks):
+        conn = connection._Connection("1.2.3.4")
+        conn._sock = _ChunkSock(chunks)
+        return conn
+
+    def test_multibyte_char_and_terminator_split_across_chunks(self):
+        blob = '{"id": 1, "result": "M42 \u00b0"}\r\n'.encode()
+        cut = blob.index(b"\xc2") + 1        # inside the UTF-8 sequence
+        conn = self._conn([blob[:cut], blob[cut:-1], blob[-1:]])
+        assert conn._next_frame() == {"id": 1, "result": "M42 \u00b0"}
+        assert conn._buf == b""
+
+    def test_several_frames_in_one_chunk_skip_blank_and_garbage(self):
+        conn = self._conn([b'\r\nnot json\r\n{"id": 1}\r\n{"id": 2}\r\n'])
+        assert conn._next_frame() == {"id": 1}
+        assert conn._next_frame() == {"id": 2}
+        with pytest.raises(ConnectionError):
+            conn._next_frame()
+
+
+# --------------------------------------------------------------------------
+# ttl_cache
+# --------------------------------------------------------------------------
+
+class TestTtlCache:
+    def _counter(self, ttl):
+        calls = []
+
+        @connection.ttl_cache(ttl)
+        def query(x=0):
+            calls.append((connection.current_ip(), x))
+            return len(calls)
+
+        return query, calls
+
+    def test_repeat_calls_hit_cache(self):
+        query, calls = self._counter(60)
+        assert query() == query() == 1
+        assert len(calls) == 1
+
+    def test_keyed_by_ip_and_args(self):
+        query, calls = self._counter(60)
+        query(1)
+        query(2)
+        connection._active.ip = "8.8.8.8"
+        query(1)
+        assert len(calls) == 3
+
+    def test_clear_and_disable(self):
+        query, calls = self._counter(60)
+        query()
+        query.cache_clear()
+        query()
+        query.ttl = 0
+        query()
+        assert len(calls) == 3
+
+    def test_unhashable_args_bypass_cache(self):
+        query, calls = self._counter(60)
+        query([1])
+        query([1])
+        assert len(calls) == 2
+
+    def test_concurrent_misses_share_one_call(self):
+        calls, release = [], threading.Event()
+
+        @connection.ttl_cache(60)
+        def slow_query():
+            calls.append(1)
+            release.wait(1)
+            return {"id": 1}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow_query()))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert results == [{"id": 1}] * 4
+        assert len({id(r) for r in results}) == 4   # each caller's own copy
+
+    def test_returned_value_is_a_copy(self):
+        calls = []
+
+        @connection.ttl_cache(60)
+        def query():
+            calls.append(1)
+            return {"result": {"lat": 48.2}}
+
+        query()["result"]["lat"] = 0.0
+        assert query() == {"result": {"lat": 48.2}}
+        assert len(calls) == 1
+
+    def test_should_cache_rejects_are_not_stored(self):
+        replies = iter([{"code": 103, "error": "busy"}, {"code": 0}])
+
+        @connection.ttl_cache(60, should_cache=lambda r: r["code"] == 0)
+        def query():
+            return next(replies)
+
+        assert query() == {"code": 103, "error": "busy"}
+        assert query() == {"code": 0}
+        assert query() == {"code": 0}       # now served from the cache
+
+    def test_errors_reach_waiters_and_are_not_cached(self):
+        calls, release = [], threading.Event()
+
+        @connection.ttl_cache(60)
+        def failing_query():
+            calls.append(1)
+            release.wait(1)
+            raise ConnectionError("down")
+
+        errors = []
+
+        def call():
+            try:
+                failing_query()
+            except ConnectionError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1 and len(errors) == 3
+        with pytest.raises(ConnectionError):
+            failing_query()
+        assert len(calls) == 2
+
+    def test_clear_during_flight_starts_fresh_query(self):
+        calls, release = [], threading.Event()
+
+        @connection.ttl_cache(60)
+        def query():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(1)
+                return "stale"
+            return "fresh"
+
+        leader = threading.Thread(target=query)
+        leader.start()
+        time.sleep(0.05)
+        query.cache_clear()
+        assert query() == "fresh"           # doesn't join the old flight
+        release.set()
+        leader.join()
+        assert query() == "fresh"           # stale result wasn't stored
+        assert len(calls) == 2
+
+    def test_waiter_falls_back_when_leader_stalls(self):
+        calls, release = [], threading.Event()
+
+        @connection.ttl_cache(60)
+        def query():
+            calls.append(threading.get_ident())
+            if len(calls) == 1:
+                release.wait(2)
+            return len(calls)
+
+        leader = threading.Thread(target=query)
+        leader.start()
+        time.sleep(0.05)
+        try:
+            with patch.object(connection._Connection, "_READ_TIMEOUT", 0.05):
+                assert query() == 2
+        finally:
+            release.set()
+            leader.join()
+
+    def test_reentrant_call_does_not_deadlock(self):
+        depth = []
+
+        @connection.ttl_cache(60)
+        def query():
+            depth.append(1)
+            return query() + 1 if len(depth) == 1 else 1
+
+        assert query() == 2
+
+    def test_clear_ttl_caches_empties_every_cache(self):
+        (q1, c1), (q2, c2) = self._counter(60), self._counter(60)
+        q1(), q2()
+        connection.clear_ttl_caches()
+        q1(), q2()
+        assert len(c1) == len(c2) == 2
+
+
+# --------------------------------------------------------------------------
+# send_command_async
+# --------------------------------------------------------------------------
+
+class TestSendCommandAsync:
+    def test_runs_off_loop_against_callers_ip(self):
+        connection._active.ip = "7.7.7.7"
+        seen = {}
+
+        class _FakeConn:
+            def send(self, params):
+                seen["thread"] = threading.current_thread()
+                return {"method": params["method"], "result": "ok"}
+
+        def fake_get_connection(ip):
+            seen["ip"] = ip
+            return _FakeConn()
+
+        with patch.object(connection, "_get_connection", fake_get_connection):
+            reply = asyncio.run(
+                connection.send_command_async({"method": "test_connection"}))
+
+        assert reply["result"] == "ok"
+        assert seen["ip"] == "7.7.7.7"
+        assert seen["thread"] is not threading.current_thread()
@@ -3,7 +3,7 @@ import os
 
 import pytest
 
-from src.seestarpy.events import event_definitions as ed
+from seestarpy.events import event_definitions as ed
 
 # Sample log lines from user input (stringified for test simulation)
 TEST_LOG_LINES = [
@@ -57,3 +57,9 @@ def test_event_class_from_json(json_str):
     for key, value in event_kwargs.items():
         actual_value = getattr(obj, key)
         assert actual_value == value, f"Mismatch in field '{key}' for event '{event_type}'"
+
+
+def test_event_watcher_uses_package_modules():
+    from seestarpy.events import event_watcher
+    assert event_watcher.evs is ed
+    assert event_watcher._EVENT_CLASSES["3PPA"][0] is ed.ThreePPA
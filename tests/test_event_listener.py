@@ -0,0 +1,132 @@
+"""Unit tests for the event listener's read loop in event_listener.py.
+
+Drives :func:`event_listener.run` against a scripted in-memory stream to
+check that ``\\r\\n`` frames are reassembled correctly no matter how the
+bytes are chunked, and that heartbeat replies are promoted to events.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from seestarpy import connection
+from seestarpy.events import event_listener, event_stream
+
+
+class _FakeReader:
+    """Hands out pre-scripted chunks, then signals shutdown and EOF."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    async def read(self, n):
+        if self._chunks:
+            return self._chunks.pop(0)
+        event_listener._shutdown_event.set()
+        return b""
+
+
+class _FakeWriter:
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+def _run_with_chunks(chunks):
+    async def main():
+        event_listener._shutdown_event = asyncio.Event()
+        reader, writer = _FakeReader(chunks), _FakeWriter()
+
+        async def fake_open_connection(*args, **kwargs):
+            return reader, writer
+
+        with patch("asyncio.open_connection", fake_open_connection):
+            await event_listener.run()
+
+    with patch("seestarpy.auth.KEY_PATH", None):
+        asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def _isolate_listener_state():
+    event_stream.LATEST_STATE.clear()
+    event_stream.LATEST_LOGS.clear()
+    with patch.object(event_listener, "VERBOSE_LEVEL", 0):
+        yield
+    event_listener._shutdown_event = None
+    event_stream.LATEST_STATE.clear()
+    event_stream.LATEST_LOGS.clear()
+
+
+def _frame(obj):
+    return (json.dumps(obj) + "\r\n").encode()
+
+
+class TestReadLoop:
+    def test_several_frames_in_one_chunk(self):
+        blob = (_frame({"Event": "PiStatus", "temp": 40})
+                + _frame({"Event": "Stack", "state": "start"}))
+        _run_with_chunks([blob])
+        assert event_stream.LATEST_STATE["PiStatus"]["temp"] == 40
+        assert event_stream.LATEST_STATE["Stack"]["state"] == "start"
+
+    def test_frame_split_across_chunks(self):
+        blob = _frame({"Event": "View", "state": "working"})
+        _run_with_chunks([blob[:5], blob[5:-1], blob[-1:]])
+        assert event_stream.LATEST_STATE["View"]["state"] == "working"
+        assert len(event_stream.LATEST_LOGS) == 1
+
+    def test_heartbeat_reply_becomes_event(self):
+        reply = {"id": 1, "method": "scope_get_equ_coord",
+                 "result": {"ra": 1.0, "dec": 2.0}, "code": 0}
+        _run_with_chunks([_frame(reply)])
+        assert event_stream.LATEST_STATE["scope_get_equ_coord"]["result"] == \
+            {"ra": 1.0, "dec": 2.0}
+
+    def test_garbage_and_blank_lines_are_skipped(self):
+        blob = b"\r\nnot json\r\n" + _frame({"Event": "Alert", "code": 270})
+        _run_with_chunks([blob])
+        assert list(event_stream.LATEST_STATE) == ["Alert"]
+
+    @pytest.mark.parametrize("orjson", [True, False])
+    def test_non_utf8_line_is_skipped(self, orjson):
+        blob = b"{\"Event\": \"\xff\xfe\"}\r\n" + _frame({"Event": "Alert",
+                                                          "code": 270})
+        with patch.object(connection, "_orjson",
+                          connection._orjson if orjson else None):
+            _run_with_chunks([blob])
+        assert list(event_stream.LATEST_STATE) == ["Alert"]
+
+    def test_stdlib_json_fallback(self):
+        blob = b"garbage\r\n" + _frame({"Event": "PiStatus", "temp": 41})
+        with patch.object(connection, "_orjson", None):
+            _run_with_chunks([blob])
+        assert list(event_stream.LATEST_STATE) == ["PiStatus"]
+
+    def test_unterminated_frame_is_capped_and_dropped(self):
+        cap = event_listener._MAX_LINE
+        junk = [b"x" * cap, b"x" * cap, b"x" * cap]
+        blob = b"tail of the junk\r\n" + _frame({"Event": "Alert",
+                                                   "code": 270})
+        with patch.object(event_listener, "_dispatch_line",
+                          wraps=event_listener._dispatch_line) as dispatch:
+            _run_with_chunks(junk + [blob])
+        assert list(event_stream.LATEST_STATE) == ["Alert"]
+        assert dispatch.call_count == 1
+
+    def test_separator_split_while_skipping(self):
+        cap = event_listener._MAX_LINE
+        chunks = [b"x" * (cap + 1), b"x\r", b"\n" + _frame({"Event": "Alert",
+                                                            "code": 270})]
+        _run_with_chunks(chunks)
+        assert list(event_stream.LATEST_STATE) == ["Alert"]
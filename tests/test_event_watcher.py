@@ -0,0 +1,71 @@
+"""Unit tests for EventWatcher._handle_event in event_watcher.py.
+
+Feeds decoded event dicts straight into the handler (no socket or event
+loop) and checks which typed dataclass instances end up stored.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from seestarpy.events import event_definitions as ed
+from seestarpy.events import event_watcher
+
+
+def _watcher():
+    """An EventWatcher without its background listen task."""
+    watcher = event_watcher.EventWatcher.__new__(event_watcher.EventWatcher)
+    watcher.events_list = []
+    watcher._events_by_type = {}
+    return watcher
+
+
+@pytest.fixture(autouse=True)
+def _quiet():
+    with patch.object(event_watcher, "VERBOSE_LEVEL", 0):
+        yield
+
+
+class TestHandleEvent:
+    def test_first_event_creates_instance(self):
+        watcher = _watcher()
+        watcher._handle_event({"Event": "PiStatus", "Timestamp": "1.0",
+                               "temp": 46.5, "battery_capacity": 42})
+        [evt] = watcher.events_list
+        assert isinstance(evt, ed.PiStatus)
+        assert (evt.temp, evt.battery_capacity) == (46.5, 42)
+
+    def test_later_events_update_same_instance(self):
+        watcher = _watcher()
+        watcher._handle_event({"Event": "PiStatus", "temp": 46.5,
+                               "battery_capacity": 42})
+        first = watcher.events_list[0]
+        watcher._handle_event({"Event": "PiStatus", "battery_capacity": 41})
+        assert watcher.events_list == [first]
+        assert (first.temp, first.battery_capacity) == (46.5, 41)
+
+    def test_3ppa_alias(self):
+        watcher = _watcher()
+        watcher._handle_event({"Event": "3PPA", "state": "complete",
+                               "lapse_ms": 74605, "percent": 99.0})
+        [evt] = watcher.events_list
+        assert isinstance(evt, ed.ThreePPA) and evt.percent == 99.0
+
+    @pytest.mark.parametrize("data", [
+        {"Event": "SomethingNew", "state": "start"},
+        {"state": "start"},
+        {"id": 1, "method": "scope_get_equ_coord", "result": {}},
+    ])
+    def test_unknown_or_missing_event_is_ignored(self, data):
+        watcher = _watcher()
+        watcher._handle_event(data)
+        assert watcher.events_list == [] and watcher._events_by_type == {}
+
+    def test_first_event_missing_required_fields_is_not_stored(self):
+        watcher = _watcher()
+        watcher._handle_event({"Event": "Alert", "error": "below horizon"})
+        assert watcher.events_list == [] and watcher._events_by_type == {}
+        watcher._handle_event({"Event": "Alert", "error": "below horizon",
+                               "code": 270})
+        [evt] = watcher.events_list
+        assert (evt.error, evt.code) == ("below horizon", 270)
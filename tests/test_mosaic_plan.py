@@ -1,11 +1,13 @@
 """Unit tests for create_mosaic_plan() in plan.py."""
 
 import math
+from datetime import date
 from unittest.mock import patch
 
 import pytest
 
-from seestarpy.plan import _generate_target_ids, create_mosaic_plan
+from seestarpy.plan import (_generate_target_ids, _today_str, create_mosaic_plan,
+                            set_view_plan)
 
 
 # ---------------------------------------------------------------------------
@@ -333,6 +335,15 @@ class TestRaWrapAround:
             ra = panel["target_ra_dec"][0]
             assert 0 <= ra < 24, f"RA {ra} out of [0, 24)"
 
+    @patch("seestarpy.plan.send_command", return_value={"code": 0})
+    def test_rounding_just_east_of_0h_is_accepted(self, mock_send):
+        """A column landing a hair west of 0h must not come out as 24.0."""
+        center_ra = math.nextafter(1 / 60, 0)   # one column sums to -3.5e-18
+        result = create_mosaic_plan("X", center_ra, 0, 3.0, 1, 0.5, 1, 60, 1320)
+        assert [p["target_ra_dec"][0] for p in result["list"]][2] == 0.0
+        set_view_plan(result)
+        mock_send.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # Validation errors
@@ -382,3 +393,13 @@ class TestValidation:
     def test_negative_height(self):
         with pytest.raises(ValueError, match="height"):
             create_mosaic_plan("X", 12, 0, 1, -1, 1, 1, 60, 1320)
+
+
+class TestTodayStr:
+    def test_follows_the_calendar_day(self):
+        with patch("seestarpy.plan.date") as mock_date:
+            mock_date.fromordinal = date.fromordinal
+            mock_date.today.return_value = date(2026, 2, 23)
+            assert _today_str() == "2026.02.23"
+            mock_date.today.return_value = date(2026, 2, 24)
+            assert _today_str() == "2026.02.24"
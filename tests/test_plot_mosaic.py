@@ -6,6 +6,7 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pytest
+from matplotlib.colors import to_rgba
 
 from seestarpy.plan import create_mosaic_plan, plot_mosaic_plan
 
@@ -30,8 +31,14 @@ def _make_3x3(center_ra=12.0, center_dec=0.0):
 
 
 def _panel_lines(ax):
-    """Return lines that are panel outlines (linewidth > 0.5)."""
-    return [ln for ln in ax.lines if ln.get_linewidth() > 0.5]
+    """Return panel outlines (linewidth > 0.5) as (N, 2) vertex arrays."""
+    return [ln.get_xydata() for ln in ax.lines if ln.get_linewidth() > 0.5]
+
+
+def _panel_colors(ax):
+    """Return the RGBA colour of every panel outline, in drawing order."""
+    return [to_rgba(ln.get_color()) for ln in ax.lines
+            if ln.get_linewidth() > 0.5]
 
 
 def _grid_lines(ax):
@@ -134,6 +141,40 @@ class TestCustomAx:
         assert returned_ax is ax
         plt.close("all")
 
+    def test_colours_follow_the_axes_cycle(self):
+        fig, ax = plt.subplots()
+        ax.set_prop_cycle(color=["red", "blue"])
+        plot_mosaic_plan(_make_3x3(), ax=ax)
+        assert _panel_colors(ax)[:3] == [
+            (1.0, 0.0, 0.0, 1.0), (0.0, 0.0, 1.0, 1.0), (1.0, 0.0, 0.0, 1.0)]
+        plt.close("all")
+
+    def test_second_plan_continues_the_cycle(self):
+        fig, ax = plt.subplots()
+        ax.set_prop_cycle(color=["red", "blue"])
+        plot_mosaic_plan(_make_3x3(), ax=ax)     # 9 panels: ends on red
+        plot_mosaic_plan(_make_3x3(), ax=ax)
+        assert _panel_colors(ax)[9] == (0.0, 0.0, 1.0, 1.0)
+        plt.close("all")
+
+
+class TestLabels:
+    def test_labels_can_be_disabled(self):
+        plan = _make_3x3()
+        ax = plot_mosaic_plan(plan, labels=False)
+        assert len(ax.texts) == 0
+        assert len(_panel_lines(ax)) == 9
+        plt.close("all")
+
+    def test_labels_at_panel_centres(self):
+        plan = _make_3x3()
+        ax = plot_mosaic_plan(plan)
+        for text, seg in zip(ax.texts, _panel_lines(ax)):
+            x, y = text.get_position()
+            assert seg[:, 0].min() < x < seg[:, 0].max()
+            assert seg[:, 1].min() < y < seg[:, 1].max()
+        plt.close("all")
+
 
 class TestCustomFov:
     def test_non_default_fov(self):
@@ -1,6 +1,7 @@
 """Unit tests for create_polygon_plan() and its helpers in plan.py."""
 
 import math
+from unittest.mock import patch
 
 import pytest
 
@@ -9,8 +10,10 @@ from seestarpy.plan import (
     _gnomonic_inverse,
     _point_in_polygon,
     _spherical_centroid,
+    _wrap_ra,
     create_polygon_plan,
     create_quadrilateral_plan,
+    set_view_plan,
 )
 
 
@@ -189,6 +192,26 @@ class TestQuadPlanWraparound:
             ra = panel["target_ra_dec"][0]
             assert 0 <= ra < 24, f"RA {ra} out of [0, 24)"
 
+    @patch("seestarpy.plan.send_command", return_value={"code": 0})
+    def test_vertex_on_0h_is_accepted(self, mock_send):
+        """A panel on RA 0h must come out as 0.0, never 24.0."""
+        result = create_polygon_plan(
+            plan_name="Diamond",
+            corners=[(0.0, -1.0), (0.2, 0.0), (0.0, 1.0), (23.8, 0.0)],
+            delta_ra=10.0,
+            delta_dec=10.0,
+            t_total=60,
+            start_min=1320,
+        )
+        assert result["list"][0]["target_ra_dec"][0] == 0.0
+        set_view_plan(result)
+        mock_send.assert_called_once()
+
+    def test_wrap_ra_snaps_24_to_0(self):
+        assert _wrap_ra(-1e-17) == 0.0
+        assert _wrap_ra(24.0) == 0.0
+        assert _wrap_ra(25.5) == 1.5
+
 
 class TestQuadPlanSingleTile:
     """When spacing > quadrilateral extent, should get 1 tile."""
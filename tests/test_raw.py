@@ -0,0 +1,125 @@
+"""Unit tests for the command wrappers in raw.py."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from seestarpy import raw
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    raw.invalidate_all_caches()
+    yield
+    raw.invalidate_all_caches()
+
+
+class TestBatch:
+    @patch("seestarpy.raw.send_commands", return_value=[{"id": 1}, {"id": 2}])
+    def test_names_and_dicts_are_sent_together(self, mock_send):
+        equ = {"method": "get_device_state", "params": {"keys": ["mount"]}}
+        result = raw.batch(equ, "scope_get_equ_coord")
+
+        mock_send.assert_called_once_with(
+            [equ, {"method": "scope_get_equ_coord"}])
+        assert result == [{"id": 1}, {"id": 2}]
+
+
+class TestRpc:
+    @patch("seestarpy.raw.send_command", return_value={"code": 0})
+    def test_wrappers_build_the_expected_payload(self, mock_send):
+        raw.get_albums()
+        assert mock_send.call_args[0][0] == {"method": "get_albums"}
+
+        raw.scope_goto(1.5, 20.0)
+        assert mock_send.call_args[0][0] == {"method": "scope_goto",
+                                             "params": [1.5, 20.0]}
+
+    @patch("seestarpy.raw.send_command", return_value={"code": 0})
+    def test_method_only_payload_is_reused(self, mock_send):
+        raw.get_camera_state()
+        raw.get_camera_state()
+        first, second = (c[0][0] for c in mock_send.call_args_list)
+        assert first is second
+        assert first == {"method": "get_camera_state"}
+
+
+class TestPiSetTime:
+    @patch("seestarpy.raw.send_command", return_value={"code": 0})
+    @patch("seestarpy.raw.time.localtime",
+           return_value=time.struct_time((2026, 3, 4, 21, 5, 9, 2, 63, 0)))
+    def test_sends_local_time(self, _, mock_send):
+        raw.pi_set_time("UTC")
+        assert mock_send.call_args[0][0] == {
+            "method": "pi_set_time",
+            "params": [{"year": 2026, "mon": 3, "day": 4, "hour": 21,
+                        "min": 5, "sec": 9, "time_zone": "UTC"}],
+        }
+
+
+class TestSetStackSetting:
+    @patch("seestarpy.raw.send_command", return_value={"code": 0})
+    def test_arguments_are_forwarded(self, mock_send):
+        with pytest.warns(DeprecationWarning):
+            raw.set_stack_setting(save_ok_frames=False,
+                                  save_rejected_frames=True)
+        assert mock_send.call_args[0][0]["params"] == {
+            "save_discrete_ok_frame": False, "save_discrete_frame": True}
+
+
+class TestCachedGetters:
+    @patch("seestarpy.raw.send_command", return_value={"result": [48.2, 16.4]})
+    def test_repeat_calls_hit_cache(self, mock_send):
+        assert raw.get_user_location() == raw.get_user_location()
+        assert mock_send.call_count == 1
+        raw.invalidate_all_caches()
+        raw.get_user_location()
+        assert mock_send.call_count == 2
+
+    @patch("seestarpy.raw.send_command", return_value={"code": 0})
+    def test_setter_clears_its_getter(self, mock_send):
+        raw.get_user_location()
+        raw.set_user_location(48.2, 16.4)
+        raw.get_user_location()
+        methods = [c[0][0]["method"] for c in mock_send.call_args_list]
+        assert methods == ["get_user_location", "set_user_location",
+                           "get_user_location"]
+
+    def test_error_replies_are_not_cached(self):
+        replies = [{"code": 207, "error": "fail to operate"},
+                   {"result": [48.2, 16.4], "code": 0}]
+        with patch("seestarpy.raw.send_command",
+                   side_effect=replies + replies[1:]) as mock_send:
+            assert "error" in raw.get_user_location()
+            assert raw.get_user_location()["result"] == [48.2, 16.4]
+            raw.get_user_location()
+        assert mock_send.call_count == 2
+
+    def test_mount_commands_keep_unrelated_caches(self):
+        with patch("seestarpy.raw.send_command",
+                   return_value={"result": [48.2, 16.4]}) as mock_send, \
+             patch("seestarpy.status.invalidate_mount_state") as mock_inv:
+            raw.get_user_location()
+            raw.scope_goto(10.0, 20.0)
+            raw.get_user_location()
+        methods = [c[0][0]["method"] for c in mock_send.call_args_list]
+        assert methods == ["get_user_location", "scope_goto"]
+        mock_inv.assert_called_once()
+
+    @pytest.mark.parametrize("getter, setter, args", [
+        ("get_user_location", "set_user_location", (48.2, 16.4)),
+        ("get_sensor_calibration", "set_sensor_calibration",
+         (1, 2, 3, 4, 5, 6, 7)),
+    ])
+    def test_poll_during_setter_is_not_kept(self, getter, setter, args):
+        replies = iter([{"result": "old"}, {"code": 0}, {"result": "new"}])
+
+        def send(params):
+            if params["method"] == setter:
+                getattr(raw, getter)()     # concurrent poll mid-RPC
+            return next(replies)
+
+        with patch("seestarpy.raw.send_command", side_effect=send):
+            getattr(raw, setter)(*args)
+            assert getattr(raw, getter)() == {"result": "new"}
@@ -6,6 +6,7 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
+from seestarpy.crowdsky import chunks
 from seestarpy.crowdsky.chunks import (
     _compute_chunk_key,
     _floor_to_block,
@@ -65,6 +66,44 @@ class TestParseLightFilename:
             "Light_M 81_20.0s_LP_20260227-225203_thn.jpg"
         ) is None
 
+    def test_invalid_date_raises(self):
+        with pytest.raises(ValueError):
+            _parse_light_filename("Light_M 81_20.0s_LP_20261327-225203.fit")
+
+
+# ---------------------------------------------------------------------------
+# _read_fits_ra_dec
+# ---------------------------------------------------------------------------
+
+def _fits_header(*cards):
+    body = b"".join(c.ljust(80).encode() for c in cards + ("END",))
+    return body.ljust(23040)
+
+
+class TestReadFitsRaDec:
+    def _read(self, header):
+        with patch("urllib.request.urlopen") as urlopen:
+            urlopen.return_value.read.return_value = header
+            return chunks._read_fits_ra_dec("MyWorks/M 81/file.fit")
+
+    def test_reads_ra_dec_cards(self):
+        header = _fits_header(
+            "SIMPLE  =                    T",
+            "RA      =     148.888221707958 / [deg] pointing RA",
+            "DEC     =     69.0652936981271 / [deg] pointing Dec",
+        )
+        assert self._read(header) == (148.888221707958, 69.0652936981271)
+
+    def test_value_not_in_column_11(self):
+        header = _fits_header("RA      =12.5 / no space after =",
+                              "DEC     =   -3.25")
+        assert self._read(header) == (12.5, -3.25)
+
+    def test_stops_at_end_card(self):
+        header = _fits_header("RA      = 10.0") + \
+            "DEC     = 20.0".ljust(80).encode()
+        assert self._read(header) == (None, None)
+
 
 # ---------------------------------------------------------------------------
 # _floor_to_block
@@ -124,7 +163,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         assert len(blocks) == 2
@@ -144,7 +183,7 @@ class TestFindUnstackedBlocks:
         # "now" is within the 22:45 block
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 27, 22, 55, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         assert len(blocks) == 0
@@ -169,7 +208,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         # The 22:45 block is covered; 23:00 block (2 frames) remains
@@ -191,7 +230,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         # Block should NOT be covered — only CrowdSky files count
@@ -216,7 +255,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         # Only the 23:00 block remains — exact match, no ambiguity
@@ -235,7 +274,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         assert len(blocks) == 2
@@ -261,7 +300,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         assert len(blocks) == 1
@@ -285,7 +324,7 @@ class TestFindUnstackedBlocks:
 
         with patch("seestarpy.crowdsky.chunks.datetime") as mock_dt:
             mock_dt.now.return_value = datetime(2026, 2, 28, 12, 0, 0)
-            mock_dt.strptime = datetime.strptime
+            mock_dt.side_effect = datetime
             blocks = find_unstacked_blocks("M 81")
 
         # Legacy file covers the 22:45 block — no unstacked blocks remain
@@ -0,0 +1,137 @@
+"""Unit tests for the status helpers in status.py."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from seestarpy import connection, status
+
+
+_DEVICE_STATE = {"result": {
+    "balance_sensor": {"data": {"angle": 1.23456}},
+    "mount": {"tracking": True, "equ_mode": False},
+    "pi_status": {"battery_capacity": 87},
+    "storage": {"storage_volume": [{"free_mb": 51234}]},
+}}
+
+_APP_STATE = {"result": {
+    "View": {"mode": "star", "state": "working", "error": "---",
+             "target_name": "M 81", "target_ra_dec": [9.9256, 69.0653],
+             "lp_filter": False,
+             "Stack": {"Exposure": {"exp_ms": 10000},
+                       "stacked_frame": 12, "dropped_frame": 1}},
+    "DarkLibrary": {"percent": 100},
+    "FocuserMove": {"position": 1580},
+    "PlateSolve": {"state": "complete", "error": "---"},
+}}
+
+
+@pytest.fixture(autouse=True)
+def _quiet():
+    connection.clear_ttl_caches()
+    with patch.object(connection, "VERBOSE_LEVEL", 0):
+        yield
+    connection.clear_ttl_caches()
+
+
+def _status_bar(dev=_DEVICE_STATE, app=_APP_STATE,
+                azalt=(45.2, 312.7), radec=(9.9301, 69.06)):
+    replies = [dev, app, {"result": list(azalt)}, {"result": list(radec)}]
+    with patch.object(status, "send_commands", return_value=replies), \
+         patch.object(status, "dt") as mock_dt:
+        mock_dt.now.return_value = datetime(2026, 3, 1, 22, 5, 7)
+        return status.status_bar()
+
+
+class TestStatusBar:
+    def test_renders_values_into_table(self):
+        rows = _status_bar().splitlines()
+        assert rows[5] == ("|      star      | 9.926   69.07  |     False      "
+                           "|      100       |   87%   |")
+        assert rows[11] == ("|      ---       | 45   313  NW   | 12       1     "
+                            "|    complete    |  False   |")
+        assert rows[14] == ("|      M 81      |     1.235      |      True      "
+                            "|      ---       | 22:05:07 |")
+
+    def test_queries_are_sent_in_one_batch(self):
+        replies = [_DEVICE_STATE, _APP_STATE, {"result": [45.2, 312.7]},
+                   {"result": [9.9301, 69.06]}]
+        with patch.object(status, "send_commands",
+                          return_value=replies) as mock_send:
+            status.status_bar()
+        mock_send.assert_called_once()
+        assert [c["method"] for c in mock_send.call_args[0][0]] == [
+            "get_device_state", "iscope_get_app_state",
+            "scope_get_horiz_coord", "scope_get_ra_dec"]
+
+    def test_plate_solve_falls_back_to_view(self):
+        view = dict(_APP_STATE["result"]["View"], PlateSolve={
+            "PlateSolve": {"state": "fail", "error": "no stars"}})
+        app = {"result": {"View": view}}
+        rows = _status_bar(app=app).splitlines()
+        assert "|      fail      |" in rows[11]
+        assert "|    no stars    |" in rows[14]
+
+    def test_uninitialised_device_shows_placeholders(self):
+        rows = _status_bar(dev={}, app={}, azalt=("---", "---"),
+                           radec=("---", "---")).splitlines()
+        assert rows[5].startswith("|      ---       | ---     ---    |")
+        assert rows[11].startswith("|      ---       | ---  ---  ---  |")
+        assert rows[14].startswith("|      ---       |      ---       |")
+
+    def test_rows_share_column_borders(self):
+        for row in _status_bar().splitlines()[1:]:
+            assert [i for i, c in enumerate(row) if c == "|"][:5] == \
+                [0, 17, 34, 51, 68]
+
+
+class TestMountState:
+    _MOUNT = {"result": {"mount": {"move_type": "none", "close": False,
+                                   "tracking": True, "equ_mode": True}}}
+
+    def test_predicates_share_one_query(self):
+        with patch.object(status.raw, "get_device_state",
+                          return_value=self._MOUNT) as mock_get:
+            assert status.is_eq_mode() is True
+            assert status.is_tracking() is True
+            assert status.is_parked() is False
+        assert mock_get.call_count == 1
+
+    def test_mount_commands_invalidate(self):
+        with patch.object(status.raw, "get_device_state",
+                          return_value=self._MOUNT) as mock_get, \
+             patch("seestarpy.raw.send_command", return_value={"code": 0}):
+            status.is_tracking()
+            status.raw.scope_set_track_state(False)
+            status.is_tracking()
+            status.invalidate_mount_state()
+            status.is_tracking()
+        assert mock_get.call_count == 3
+
+    def test_error_reply_is_not_cached(self):
+        error = {"id": 1, "code": 103, "error": "method not found"}
+        with patch.object(status.raw, "get_device_state",
+                          side_effect=[error, self._MOUNT]) as mock_get:
+            assert status.get_mount_state() == {}
+            assert status.is_tracking() is True
+            assert status.is_tracking() is True
+        assert mock_get.call_count == 2
+
+
+class TestAzimuthToCompass:
+    @pytest.mark.parametrize("deg, point", [(0, "N"), (11.24, "N"),
+                                            (11.25, "NNE"), (135, "SE"),
+                                            (312.7, "NW"), (348.75, "N"),
+                                            (360, "N"), (-90, "W"),
+                                            (-11.26, "NNW"), (725, "N")])
+    def test_scalar(self, deg, point):
+        assert status.azimuth_to_compass(deg) == point
+
+    def test_array_matches_scalar(self):
+        np = pytest.importorskip("numpy")
+        degs = np.linspace(-720, 720, 1441)
+        points = status.azimuth_to_compass(degs)
+        assert points.shape == degs.shape
+        assert list(points) == [status.azimuth_to_compass(float(d))
+                                for d in degs]
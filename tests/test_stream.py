@@ -0,0 +1,325 @@
+"""Unit tests for the binary image stream helpers in stream.py.
+
+Exercises :class:`stream.StreamSession`'s live-display plumbing without a
+socket: frames are fed straight into the display callback and rendered
+on demand.
+"""
+
+import struct
+import threading
+import time
+import zlib
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from seestarpy import stream
+
+
+def _header(width=4, height=2, img_type=stream.IMG_TYPE_PREVIEW, image_id=1):
+    return {
+        'width': width, 'height': height, 'img_type': img_type,
+        'image_id': image_id, 'length': width * height * 2,
+    }
+
+
+def _bayer_payload(width=4, height=2):
+    return struct.pack(f'<{width * height}H', *range(width * height))
+
+
+def _stacked_payload(width=4, height=2):
+    """A minimal streaming-ZIP payload holding 16-bit RGB pixels."""
+    pixels = struct.pack(f'<{width * height * 3}H', *range(width * height * 3))
+    deflate = zlib.compressobj(wbits=-15)
+    data = deflate.compress(pixels) + deflate.flush()
+    return stream._ZIP_LOCAL_SIG + bytes(22) + struct.pack('<HH', 0, 0) + data
+
+
+def _session():
+    return stream.StreamSession("1.2.3.4", stream.IMAGE_PORT, None, None)
+
+
+# --------------------------------------------------------------------------
+# Display conversion
+# --------------------------------------------------------------------------
+
+def _reference_stretch(arr):
+    """Straightforward out-of-place version of the _auto_stretch maths."""
+    img = arr.astype(np.float32)
+    black = np.percentile(img, 0.5, axis=(0, 1), keepdims=True)
+    white = np.percentile(img, 99.95, axis=(0, 1), keepdims=True)
+    img = np.clip((img - black) / (white - black + 1e-6), 0.0, 1.0)
+    m = 0.15
+    img = (m - 1.0) * img / ((2.0 * m - 1.0) * img - m)
+    return (img * 255.0 + 0.5).astype(np.uint8)
+
+
+class TestAutoStretch:
+    def test_matches_reference_mtf(self):
+        rng = np.random.default_rng(1)
+        arr = rng.integers(0, 65535, size=(24, 32, 3), dtype=np.uint16)
+        np.testing.assert_array_equal(stream._auto_stretch(arr),
+                                      _reference_stretch(arr))
+
+    def test_uint16_percentiles_match_numpy(self):
+        rng = np.random.default_rng(2)
+        arr = rng.integers(0, 4000, size=(37, 23, 3), dtype=np.uint16)
+        qs = (0.0, 0.5, 50.0, 99.95, 100.0)
+        got = stream._uint16_percentiles(arr, qs)
+        for q, g in zip(qs, got):
+            expected = np.percentile(arr.astype(np.float32), q,
+                                     axis=(0, 1), keepdims=True)
+            assert g.shape == expected.shape and g.dtype == np.float32
+            np.testing.assert_allclose(g, expected, rtol=1e-6)
+
+
+class TestToRgb8:
+    def test_bayer_matches_stretching_stacked_channels(self):
+        rng = np.random.default_rng(0)
+        arr = rng.integers(0, 65535, size=(16, 12), dtype=np.uint16)
+        expected = stream._auto_stretch(np.stack([arr, arr, arr], axis=2))
+        np.testing.assert_array_equal(stream._to_rgb8(arr), expected)
+
+    def test_unstretched_keeps_top_byte(self):
+        arr = np.full((2, 2, 3), 0xAB12, dtype=np.uint16)
+        arr8 = stream._to_rgb8(arr, stretch=False)
+        assert arr8.dtype == np.uint8 and (arr8 == 0xAB).all()
+
+
+# --------------------------------------------------------------------------
+# Header parsing
+# --------------------------------------------------------------------------
+
+class TestParseHeader:
+    def test_fields_match_byte_offsets(self):
+        buf = bytes(range(1, stream.HEADER_SIZE + 1))
+        u16 = lambda off: struct.unpack_from('>H', buf, off)[0]
+        header = stream.parse_header(buf)
+        assert header == {
+            'magic': u16(0), 'version': u16(2),
+            'length': struct.unpack_from('>I', buf, 6)[0],
+            'is_big_endian': buf[12], 'img_type': buf[13],
+            'data_type': buf[14], 'frame_id': buf[15],
+            'width': u16(16), 'height': u16(18), 'hfd_x': u16(20),
+            'hfd_y': u16(22), 'hfd': u16(24), 'can_debayer': u16(26),
+            'image_id': u16(28),
+        }
+
+    def test_wrong_size_is_rejected(self):
+        with pytest.raises(ValueError, match="34 bytes"):
+            stream.parse_header(b"\x03\xc3")
+
+
+# --------------------------------------------------------------------------
+# Socket reads
+# --------------------------------------------------------------------------
+
+class _ChunkSock:
+    """Hands out pre-split byte chunks via recv_into, then EOF."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def recv_into(self, view):
+        if not self._chunks:
+            return 0
+        chunk = self._chunks.pop(0)
+        k = min(len(chunk), len(view))
+        view[:k] = chunk[:k]
+        if k < len(chunk):
+            self._chunks.insert(0, chunk[k:])
+        return k
+
+
+class TestRecvExact:
+    def test_reassembles_chunks(self):
+        sock = _ChunkSock([b"ab", b"cde", b"f"])
+        assert stream._recv_exact(sock, 6) == b"abcdef"
+
+    def test_zero_length(self):
+        assert stream._recv_exact(_ChunkSock([]), 0) == b""
+
+    def test_early_close_raises(self):
+        with pytest.raises(ConnectionError, match="3/6"):
+            stream._recv_exact(_ChunkSock([b"abc"]), 6)
+
+    def test_read_frame_skips_json_and_returns_payload(self):
+        payload = _bayer_payload()
+        header = bytearray(stream.HEADER_SIZE)
+        struct.pack_into('>HH2xI', header, 0, stream.MAGIC_NUMBER, 1,
+                         len(payload))
+        struct.pack_into('>HH', header, 16, 4, 2)
+        blob = b'{"id": 2, "result": 0}\r\n' + bytes(header) + payload
+        sock = _ChunkSock([blob[i:i + 7] for i in range(0, len(blob), 7)])
+        hdr, data = stream._read_frame(sock)
+        assert (hdr['width'], hdr['height']) == (4, 2)
+        assert data == payload
+
+    @staticmethod
+    def _raw_header(length, width=4, height=2):
+        header = bytearray(stream.HEADER_SIZE)
+        struct.pack_into('>HH2xI', header, 0, stream.MAGIC_NUMBER, 1, length)
+        struct.pack_into('>HH', header, 16, width, height)
+        return bytes(header)
+
+    def test_read_frame_skips_oversized_ack(self):
+        body = b"x" * (stream._RECV_BUF + 10)
+        payload = _bayer_payload()
+        blob = (self._raw_header(len(body), 0, 0) + body
+                + self._raw_header(len(payload)) + payload)
+        sock = _ChunkSock([blob[i:i + 4096] for i in range(0, len(blob), 4096)])
+        with patch("builtins.print"):
+            hdr, data = stream._read_frame(sock)
+        assert (hdr['width'], hdr['height']) == (4, 2) and data == payload
+
+    def test_read_frame_resyncs_after_corrupt_length(self):
+        payload = _bayer_payload()
+        blob = (self._raw_header(0xFFFFFFFF) + b"\x00" * 8
+                + self._raw_header(len(payload)) + payload)
+        with patch("builtins.print") as mock_print:
+            hdr, data = stream._read_frame(_ChunkSock([blob]))
+        assert data == payload
+        assert "resynchronising" in mock_print.call_args[0][0]
+
+
+# --------------------------------------------------------------------------
+# Live display
+# --------------------------------------------------------------------------
+
+class TestDisplay:
+    def test_frames_are_rendered_only_on_demand(self):
+        session = _session()
+        decoded = []
+        orig = stream.decode_payload
+
+        def counting_decode(payload, header):
+            decoded.append(header['image_id'])
+            return orig(payload, header)
+
+        with patch.object(stream, "decode_payload", counting_decode):
+            for i in range(5):
+                session._display_callback(_header(image_id=i), _bayer_payload())
+            header, arr8 = session._render_latest()
+
+        assert decoded == [4]
+        assert header['image_id'] == 4
+        assert arr8.shape == (2, 4, 3) and arr8.dtype == np.uint8
+
+    def test_same_frame_is_not_rendered_twice(self):
+        session = _session()
+        session._display_callback(_header(), _bayer_payload())
+        assert session._render_latest() is not None
+        assert session._render_latest() is None
+
+    def test_keepalive_frames_are_dropped(self):
+        session = _session()
+        session._display_callback(_header(width=0, height=0), b"")
+        assert session._latest_frame is None
+
+    def test_previews_ignored_after_stacked(self):
+        session = _session()
+        stacked = _header(img_type=stream.IMG_TYPE_STACKED, image_id=7)
+        session._display_callback(stacked, b"zip")
+        session._display_callback(_header(image_id=8), _bayer_payload())
+        assert session._latest_frame[0]['image_id'] == 7
+
+    def test_previews_ignored_once_stacked_frame_is_shown(self):
+        session = _session()
+        stacked = _header(img_type=stream.IMG_TYPE_STACKED, image_id=7)
+        session._display_callback(stacked, _stacked_payload())
+        assert session._render_latest()[0]['image_id'] == 7
+        session._display_callback(_header(image_id=8), _bayer_payload())
+        assert session._render_latest() is None
+
+    def test_corrupt_stacked_frame_does_not_block_previews(self):
+        session = _session()
+        stacked = _header(img_type=stream.IMG_TYPE_STACKED, image_id=7)
+        session._display_callback(stacked, b"corrupt")
+        assert session._render_latest() is None     # fails to decode
+        session._display_callback(_header(image_id=8), _bayer_payload())
+        header, arr8 = session._render_latest()
+        assert header['image_id'] == 8 and arr8.shape == (2, 4, 3)
+
+
+# --------------------------------------------------------------------------
+# wait_for_frame
+# --------------------------------------------------------------------------
+
+class TestWaitForFrame:
+    def test_returns_next_frame_from_reader(self):
+        session = _session()
+        frame = (_header(image_id=3), _bayer_payload())
+        reads = [frame]
+
+        def fake_read_frame(sock):
+            if reads:
+                time.sleep(0.05)
+                return reads.pop(0)
+            session._stop_event.wait(1)
+            raise ConnectionError("closed")
+
+        with patch.object(stream, "_read_frame", fake_read_frame):
+            reader = threading.Thread(target=session._reader_loop)
+            reader.start()
+            try:
+                assert session.wait_for_frame(timeout=1) == frame
+            finally:
+                session._stop_event.set()
+                reader.join()
+
+    def test_skips_ack_frames(self):
+        session = _session()
+        ack = (_header(width=0, height=0, image_id=2), b"")
+        frame = (_header(image_id=3), _bayer_payload())
+        reads = [ack, frame]
+
+        def fake_read_frame(sock):
+            if reads:
+                time.sleep(0.05)
+                return reads.pop(0)
+            session._stop_event.wait(1)
+            raise ConnectionError("closed")
+
+        with patch.object(stream, "_read_frame", fake_read_frame):
+            reader = threading.Thread(target=session._reader_loop)
+            reader.start()
+            try:
+                assert session.wait_for_frame(timeout=1) == frame
+            finally:
+                session._stop_event.set()
+                reader.join()
+
+    def test_frame_published_just_before_waiting_is_returned(self):
+        session = _session()
+        frame = (_header(image_id=5), _bayer_payload())
+        cond = session._frame_cond
+
+        class _RacingCond:
+            """Publishes a frame after the snapshot, just before waiting."""
+
+            def __enter__(self):
+                return cond.__enter__()
+
+            def __exit__(self, *exc):
+                return cond.__exit__(*exc)
+
+            def notify_all(self):
+                cond.notify_all()
+
+            def wait_for(self, predicate, timeout=None):
+                session._publish_frame(*frame)
+                return cond.wait_for(predicate, timeout)
+
+        session._frame_cond = _RacingCond()
+        start = time.monotonic()
+        assert session.wait_for_frame(timeout=5) == frame
+        assert time.monotonic() - start < 1
+
+    def test_times_out(self):
+        assert _session().wait_for_frame(timeout=0.01) is None
+
+    def test_returns_none_once_stopped(self):
+        session = _session()
+        session.is_running = False
+        assert session.wait_for_frame() is None
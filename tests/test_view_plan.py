@@ -0,0 +1,158 @@
+"""Unit tests for set_view_plan() and the Target type in plan.py."""
+
+from unittest.mock import patch
+
+import pytest
+
+from seestarpy import plan as plan_mod
+from seestarpy import status
+from seestarpy.plan import Target, set_view_plan, stop_view_plan
+
+
+def _target_dict(**overrides):
+    target = {
+        "target_id": 123456789,
+        "target_name": "M42",
+        "alias_name": "Orion Nebula",
+        "target_ra_dec": [5.588, -5.39],
+        "lp_filter": True,
+        "start_min": 1350,
+        "duration_min": 30,
+    }
+    target.update(overrides)
+    return target
+
+
+def _plan(targets):
+    return {"plan_name": "Test", "update_time_seestar": "2026.02.23",
+            "list": targets}
+
+
+# ---------------------------------------------------------------------------
+# Target
+# ---------------------------------------------------------------------------
+
+class TestTarget:
+    def test_to_dict_matches_plain_target(self):
+        t = Target(123456789, "M42", (5.588, -5.39), start_min=1350,
+                   duration_min=30, alias_name="Orion Nebula", lp_filter=True)
+        assert t.to_dict() == _target_dict()
+
+    def test_is_slotted_and_frozen(self):
+        t = Target(1, "M31", (0.712, 41.27), 1380, 45)
+        assert not hasattr(t, "__dict__")
+        with pytest.raises(AttributeError):
+            t.target_name = "M33"
+
+
+# ---------------------------------------------------------------------------
+# set_view_plan
+# ---------------------------------------------------------------------------
+
+class TestSetViewPlan:
+    @patch("seestarpy.plan.send_command", return_value={"code": 0})
+    def test_targets_are_sent_as_dicts(self, mock_send):
+        t = Target(123456789, "M42", (5.588, -5.39), start_min=1350,
+                   duration_min=30, alias_name="Orion Nebula", lp_filter=True)
+        plan = _plan([t, _target_dict(target_id=2)])
+        set_view_plan(plan)
+
+        sent = mock_send.call_args[0][0]["params"]
+        assert sent["list"] == [_target_dict(), _target_dict(target_id=2)]
+        assert plan["list"][0] is t            # caller's plan untouched
+
+    @patch("seestarpy.plan.send_command", return_value={"code": 0})
+    def test_dict_plan_is_sent_unchanged(self, mock_send):
+        plan = _plan([_target_dict()])
+        set_view_plan(plan)
+        assert mock_send.call_args[0][0] == {"method": "set_view_plan",
+                                             "params": plan}
+
+    @pytest.mark.parametrize("ra_dec", [[24.0, 0.0], [-0.1, 0.0],
+                                        [1.0, 90.5], [1.0, -91.0]])
+    @patch("seestarpy.plan.send_command")
+    def test_out_of_range_ra_dec_is_rejected(self, mock_send, ra_dec):
+        plan = _plan([_target_dict(), _target_dict(target_ra_dec=ra_dec)])
+        with pytest.raises(ValueError, match="Target 1"):
+            set_view_plan(plan)
+        mock_send.assert_not_called()
+
+    @pytest.mark.parametrize("ra_dec", [None, 5.588, [5.588], [1, 2, 3],
+                                        ["12h", 5], [12, None]])
+    @patch("seestarpy.plan.send_command")
+    def test_missing_or_malformed_ra_dec_is_rejected(self, mock_send, ra_dec):
+        bad = _target_dict()
+        if ra_dec is None:
+            del bad["target_ra_dec"]
+        else:
+            bad["target_ra_dec"] = ra_dec
+        with pytest.raises(ValueError, match="Target 1: target_ra_dec"):
+            set_view_plan(_plan([_target_dict(), bad]))
+        mock_send.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# get_running_plan cache
+# ---------------------------------------------------------------------------
+
+class TestRunningPlanCache:
+    _OLD = {"result": {"ViewPlan": {"state": "working"}}}
+    _NEW = {"result": {"ViewPlan": {"state": "cancel"}}}
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        plan_mod.get_running_plan.cache_clear()
+        yield
+        plan_mod.get_running_plan.cache_clear()
+
+    def _send_polling_midway(self, mock_state):
+        """Fake send_command that lets a 'concurrent' poll run mid-RPC."""
+        def send(params):
+            plan_mod.get_running_plan()      # caches the pre-command state
+            mock_state.return_value = self._NEW
+            return {"code": 0}
+        return send
+
+    @pytest.mark.parametrize("call", [
+        lambda: set_view_plan(_plan([_target_dict()])),
+        stop_view_plan,
+    ])
+    def test_cache_is_cleared_after_the_command(self, call):
+        with patch.object(plan_mod, "iscope_get_app_state",
+                          return_value=self._OLD) as mock_state:
+            with patch.object(plan_mod, "send_command",
+                              self._send_polling_midway(mock_state)):
+                call()
+            assert plan_mod.get_running_plan() == {"state": "cancel"}
+
+    def test_error_reply_is_not_cached(self):
+        error = {"id": 1, "code": 103, "error": "method not found"}
+        with patch.object(plan_mod, "iscope_get_app_state",
+                          side_effect=[error, self._OLD]) as mock_state:
+            assert plan_mod.get_running_plan() is None
+            assert plan_mod.get_running_plan() == {"state": "working"}
+            assert plan_mod.get_running_plan() == {"state": "working"}
+        assert mock_state.call_count == 2
+
+    def test_ttl_zero_disables_the_cache(self, monkeypatch):
+        monkeypatch.setattr(plan_mod.get_running_plan, "ttl", 0)
+        with patch.object(plan_mod, "iscope_get_app_state",
+                          return_value=self._OLD) as mock_state:
+            plan_mod.get_running_plan()
+            plan_mod.get_running_plan()
+        assert mock_state.call_count == 2
+
+    @pytest.mark.parametrize("call", [
+        lambda: set_view_plan(_plan([_target_dict()])),
+        stop_view_plan,
+    ])
+    def test_mount_state_is_invalidated(self, call):
+        mount = {"result": {"mount": {"tracking": True}}}
+        status.invalidate_mount_state()
+        with patch.object(status.raw, "get_device_state",
+                          return_value=mount) as mock_get, \
+             patch.object(plan_mod, "send_command", return_value={"code": 0}):
+            status.get_mount_state()
+            call()
+            status.get_mount_state()
+        assert mock_get.call_count == 2